@@ -0,0 +1,67 @@
+"""Things that many benchmark scripts need.
+
+The scripts are in the same directory as this file, so they can import
+this like any other module.
+"""
+
+import argparse
+import os
+import resource
+import sys
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+EXAMPLES = os.path.join(_HERE, os.pardir, 'examples')
+
+
+def add_example_dir(chapter):
+    """Make the modules in examples/chapter importable."""
+    sys.path.insert(0, os.path.join(EXAMPLES, chapter))
+
+
+def add_real_tk_option(parser):
+    parser.add_argument(
+        '--real-tk', action='store_true',
+        help="use the real tkinter, this needs a display")
+
+
+def install_tkinter(real_tk):
+    """Make 'import tkinter' import faketk.py unless real_tk is true.
+
+    Call this before importing anything that imports tkinter.
+    """
+    if not real_tk:
+        import faketk
+        faketk.install()
+
+
+def peak_rss_megabytes():
+    """Return the peak memory usage of this process."""
+    # ru_maxrss is in kilobytes on linux, but in bytes on mac
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':
+        peak /= 1024
+    return peak / 1024
+
+
+# many scripts run each case in a new process, so that the peak memory
+# usage of one case doesn't affect the others, and the new process runs
+# the same script with a hidden --subprocess option
+def add_subprocess_option(parser, *metavar):
+    """Add the hidden --subprocess option to an argument parser.
+
+    The option takes one argument for each metavar, e.g. 'CASE' and
+    'COUNT', and it's None if the script wasn't started by
+    subprocess_command().
+    """
+    parser.add_argument(
+        '--subprocess', nargs=len(metavar), metavar=metavar,
+        help=argparse.SUPPRESS)
+
+
+def subprocess_command(script, arguments, options=()):
+    """Return a command that runs script with --subprocess arguments.
+
+    The options are other command-line options for the script.
+    """
+    return ([sys.executable, os.path.abspath(script)] + list(options)
+            + ['--subprocess'] + [str(argument) for argument in arguments])
@@ -0,0 +1,477 @@
+#!/usr/bin/env python3
+"""Benchmark the patterns in examples/event-loop-stuff.
+
+Each pattern is ran like in the example, but with many messages and
+without waiting for the user to click anything. By default this uses
+faketk.py, so no display is needed, and --real-tk uses the real tkinter
+instead. For example:
+
+    $ python3 benchmarks/event-loop.py
+    $ python3 benchmarks/event-loop.py --messages 500 --rate 100 thread2tk
+
+The latency is the time between a thread or a callback sending a message
+and the other side noticing it. For the clock pattern, it's how late
+each tick is compared to a clock that doesn't drift. The idle CPU usage
+is measured while the pattern waits for something that doesn't happen.
+
+The examples are programs that show windows and wait for clicks, so
+they can't be imported here. Instead, the code of each example is
+copied to the function of its pattern, with the example's widgets and
+sleeps replaced by timestamps. If you change an example, change the
+copy here too, or the benchmark keeps measuring the old code. The
+helper modules tkbridge.py, tkscheduler.py and tkasyncio.py are
+imported, so they don't need to be copied.
+"""
+
+import argparse
+import queue
+import threading
+import time
+
+import benchutils
+
+benchutils.add_example_dir('event-loop-stuff')
+
+# {name: function}, see @pattern
+PATTERNS = {}
+
+
+def pattern(name):
+    def decorator(function):
+        PATTERNS[name] = function
+        return function
+    return decorator
+
+
+def busy_wait(seconds):
+    # like a callback that takes some time to run
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+def producer(the_queue, count, rate, idle_time):
+    """Put timestamps to the queue like thread_target in thread2tk.py."""
+    for number in range(count):
+        the_queue.put(time.perf_counter())
+        if rate:
+            time.sleep(1 / rate)
+    time.sleep(idle_time)
+    the_queue.put(None)
+
+
+@pattern('thread2tk')
+def bench_thread2tk(tk, args, count, idle_time):
+    """A thread puts messages to a queue, an after callback gets them.
+
+    This is a copy of thread2tk.py.
+    """
+    the_queue = queue.Queue()
+    latencies = []
+    root = tk.tkinter.Tk()
+    label = tk.ttk.Label(root)
+
+    def after_callback(interval):
+        messages = []
+        stop_time = time.monotonic() + 0.05
+        while time.monotonic() < stop_time:
+            try:
+                messages.append(the_queue.get(block=False))
+            except queue.Empty:
+                break
+
+        now = time.perf_counter()
+        sent_times = [sent for sent in messages if sent is not None]
+        if sent_times:
+            label['text'] = "hello %d" % len(latencies)
+            latencies.extend(now - sent for sent in sent_times)
+
+        if None in messages:
+            root.destroy()
+            return
+        if messages:
+            interval = 20
+        else:
+            interval = min(interval * 2, 200)
+        root.after(interval, after_callback, interval)
+
+    threading.Thread(target=producer,
+                     args=[the_queue, count, args.rate, idle_time]).start()
+    root.after(args.interval, after_callback, args.interval)
+    root.mainloop()
+    return latencies
+
+
+@pattern('thread2tk-one-per-tick')
+def bench_thread2tk_one_per_tick(tk, args, count, idle_time):
+    """Like thread2tk, but the after callback gets one message per call.
+
+    This is how thread2tk.py used to do it.
+    """
+    the_queue = queue.Queue()
+    latencies = []
+    root = tk.tkinter.Tk()
+    label = tk.ttk.Label(root)
+
+    def after_callback():
+        try:
+            sent = the_queue.get(block=False)
+        except queue.Empty:
+            root.after(args.interval, after_callback)
+            return
+
+        if sent is None:
+            root.destroy()
+            return
+        label['text'] = "hello %d" % len(latencies)
+        latencies.append(time.perf_counter() - sent)
+        root.after(args.interval, after_callback)
+
+    threading.Thread(target=producer,
+                     args=[the_queue, count, args.rate, idle_time]).start()
+    root.after(args.interval, after_callback)
+    root.mainloop()
+    return latencies
+
+
+@pattern('bridge')
+def bench_bridge(tk, args, count, idle_time):
+    """A thread runs functions in the main loop with tkbridge.Bridge."""
+    import tkbridge
+
+    latencies = []
+    root = tk.tkinter.Tk()
+    label = tk.ttk.Label(root)
+    bridge = tkbridge.Bridge(root)
+
+    def show_message(sent):
+        label['text'] = "hello %d" % len(latencies)
+        latencies.append(time.perf_counter() - sent)
+
+    def thread_target():
+        for number in range(count):
+            bridge.call(show_message, time.perf_counter())
+            if args.rate:
+                time.sleep(1 / args.rate)
+        time.sleep(idle_time)
+        bridge.call(root.destroy)
+
+    thread = threading.Thread(target=thread_target)
+    thread.start()
+    root.mainloop()
+    thread.join()
+    bridge.close()
+    return latencies
+
+
+@pattern('is_alive')
+def bench_is_alive(tk, args, count, idle_time):
+    """An after callback checks thread.is_alive() until it's done.
+
+    This is a copy of is_alive.py.
+    """
+    latencies = []
+    end_times = []
+    root = tk.tkinter.Tk()
+
+    def do_slow_stuff(seconds):
+        time.sleep(seconds)
+        end_times.append(time.perf_counter())
+
+    def check_if_ready(thread):
+        if thread.is_alive():
+            root.after(args.is_alive_interval, check_if_ready, thread)
+            return
+
+        latencies.append(time.perf_counter() - end_times[-1])
+        if len(latencies) < count:
+            start_doing_slow_stuff(args.work / 1000)
+        else:
+            root.destroy()
+
+    def start_doing_slow_stuff(seconds):
+        thread = threading.Thread(target=do_slow_stuff, args=[seconds])
+        thread.start()
+        root.after(args.is_alive_interval, check_if_ready, thread)
+
+    if count == 0:
+        # the thread runs for idle_time, and then we're done
+        count = 1
+        start_doing_slow_stuff(idle_time)
+    else:
+        start_doing_slow_stuff(args.work / 1000)
+    root.mainloop()
+    return latencies[:-1] if idle_time else latencies
+
+
+@pattern('tk2thread')
+def bench_tk2thread(tk, args, count, idle_time):
+    """Clicks put messages to a queue, a thread does something with them.
+
+    This is a copy of tk2thread.py.
+    """
+    the_queue = queue.Queue()
+    latencies = []
+    root = tk.tkinter.Tk()
+
+    def thread_target():
+        while True:
+            sent = the_queue.get()
+            if sent is None:
+                return
+            time.sleep(args.work / 1000)
+            latencies.append(time.perf_counter() - sent)
+
+    def on_click(clicks_left):
+        if clicks_left == 0:
+            root.after(int(idle_time * 1000), root.destroy)
+            return
+        the_queue.put(time.perf_counter())
+        root.after(int(1000 / args.rate) if args.rate else 0,
+                   on_click, clicks_left - 1)
+
+    thread = threading.Thread(target=thread_target)
+    thread.start()
+    on_click(count)
+    root.mainloop()
+
+    the_queue.put(None)
+    thread.join()
+    return latencies
+
+
+@pattern('tk2thread-pool')
+def bench_tk2thread_pool(tk, args, count, idle_time):
+    """Like tk2thread, but with many threads and a limited queue.
+
+    This is a copy of tk2thread-pool.py.
+    """
+    job_queue = queue.Queue(maxsize=args.queue_size)
+    result_queue = queue.Queue()
+    latencies = []
+    dropped = []
+    root = tk.tkinter.Tk()
+    label = tk.ttk.Label(root)
+
+    def thread_target():
+        while True:
+            sent = job_queue.get()
+            if sent is None:
+                return
+            time.sleep(args.work / 1000)
+            result_queue.put(sent)
+
+    def check_results():
+        now = time.perf_counter()
+        while True:
+            try:
+                latencies.append(now - result_queue.get(block=False))
+            except queue.Empty:
+                break
+        label['text'] = "%d done" % len(latencies)
+        root.after(args.interval, check_results)
+
+    def on_click(clicks_left):
+        if clicks_left == 0:
+            root.after(int(idle_time * 1000), root.destroy)
+            return
+        try:
+            job_queue.put(time.perf_counter(), block=False)
+        except queue.Full:
+            dropped.append(clicks_left)
+        root.after(int(1000 / args.rate) if args.rate else 0,
+                   on_click, clicks_left - 1)
+
+    threads = [threading.Thread(target=thread_target)
+               for i in range(args.workers)]
+    for thread in threads:
+        thread.start()
+    on_click(count)
+    root.after(args.interval, check_results)
+    root.mainloop()
+
+    for thread in threads:
+        job_queue.put(None)
+    for thread in threads:
+        thread.join()
+    if dropped:
+        print("tk2thread-pool: %d of %d jobs were dropped" % (
+            len(dropped), count))
+    return latencies
+
+
+@pattern('timeout-clock')
+def bench_timeout_clock(tk, args, count, idle_time):
+    """A callback reschedules itself with root.after() after its work.
+
+    This is a copy of timeout-clock.py.
+    """
+    latencies = []
+    root = tk.tkinter.Tk()
+    label = tk.ttk.Label(root)
+    period = args.clock_period
+    if count == 0:
+        count = int(idle_time * 1000 / period)
+    start = time.perf_counter()
+
+    def change_text():
+        # drift is how late we are compared to where a perfect clock is
+        ideal = start + (len(latencies) + 1) * period / 1000
+        latencies.append(time.perf_counter() - ideal)
+        label['text'] = time.asctime()
+        busy_wait(args.work / 1000)
+        if len(latencies) == count:
+            root.destroy()
+        else:
+            root.after(period, change_text)
+
+    root.after(period, change_text)
+    root.mainloop()
+    return latencies
+
+
+@pattern('scheduler-clock')
+def bench_scheduler_clock(tk, args, count, idle_time):
+    """Like timeout-clock, but with tkscheduler.Scheduler."""
+    import tkscheduler
+
+    latencies = []
+    root = tk.tkinter.Tk()
+    label = tk.ttk.Label(root)
+    scheduler = tkscheduler.Scheduler(root)
+    if count == 0:
+        count = int(idle_time * 1000 / args.clock_period)
+
+    def change_text():
+        # the scheduler aligns deadlines to time.time(), so the drift is
+        # measured against the task's own deadlines
+        latencies.append(time.time() - (start + len(latencies) * period))
+        label['text'] = time.asctime()
+        busy_wait(args.work / 1000)
+        if len(latencies) == count:
+            root.destroy()
+
+    task = scheduler.add(args.clock_period, change_text)
+    start = task.deadline
+    period = task.period
+    root.mainloop()
+    return latencies
+
+
+@pattern('asyncio-clock')
+def bench_asyncio_clock(tk, args, count, idle_time):
+    """A coroutine does the clock's work and awaits asyncio.sleep()."""
+    import asyncio
+    import tkasyncio
+
+    latencies = []
+    root = tk.tkinter.Tk()
+    label = tk.ttk.Label(root)
+    period = args.clock_period
+    if count == 0:
+        count = int(idle_time * 1000 / period)
+
+    async def change_text():
+        start = time.perf_counter()
+        while len(latencies) < count:
+            await asyncio.sleep(period / 1000)
+            ideal = start + (len(latencies) + 1) * period / 1000
+            latencies.append(time.perf_counter() - ideal)
+            label['text'] = time.asctime()
+            busy_wait(args.work / 1000)
+        root.destroy()
+
+    async def main():
+        asyncio.ensure_future(change_text())
+        await tkasyncio.run_tk(root)
+
+    asyncio.run(main())
+    return latencies
+
+
+def percentile(sorted_values, percent):
+    if not sorted_values:
+        return float('nan')
+    index = round(percent / 100 * (len(sorted_values) - 1))
+    return sorted_values[index]
+
+
+def run_pattern(tk, args, function):
+    start = time.perf_counter()
+    latencies = sorted(function(tk, args, args.messages, 0))
+    elapsed = time.perf_counter() - start
+
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    function(tk, args, 0, args.idle_time)
+    idle_cpu = ((time.process_time() - cpu_start)
+                / (time.perf_counter() - wall_start))
+
+    ms = [1000 * latency for latency in latencies]
+    return [len(latencies) / elapsed, percentile(ms, 50), percentile(ms, 90),
+            percentile(ms, 99), max(ms, default=float('nan')),
+            100 * idle_cpu]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n\n')[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'patterns', nargs='*', metavar='PATTERN',
+        help="patterns to run (default: all), one of: " + ', '.join(PATTERNS))
+    benchutils.add_real_tk_option(parser)
+    parser.add_argument(
+        '--messages', type=int, default=100,
+        help="number of messages or jobs (default: %(default)s)")
+    parser.add_argument(
+        '--rate', type=float, default=20,
+        help="messages per second, 0 means as fast as possible "
+             "(default: %(default)s)")
+    parser.add_argument(
+        '--interval', type=int, default=100,
+        help="milliseconds between queue checks, or before the first "
+             "check for thread2tk (default: %(default)s)")
+    parser.add_argument(
+        '--is-alive-interval', type=int, default=200,
+        help="milliseconds between is_alive() checks (default: %(default)s)")
+    parser.add_argument(
+        '--clock-period', type=int, default=50,
+        help="milliseconds between clock ticks (default: %(default)s)")
+    parser.add_argument(
+        '--work', type=float, default=5,
+        help="milliseconds that each job or tick takes "
+             "(default: %(default)s)")
+    parser.add_argument(
+        '--workers', type=int, default=4,
+        help="number of threads for tk2thread-pool (default: %(default)s)")
+    parser.add_argument(
+        '--queue-size', type=int, default=10,
+        help="maximum number of waiting jobs for tk2thread-pool "
+             "(default: %(default)s)")
+    parser.add_argument(
+        '--idle-time', type=float, default=2,
+        help="seconds to measure idle CPU usage for (default: %(default)s)")
+    args = parser.parse_args()
+
+    for name in args.patterns:
+        if name not in PATTERNS:
+            parser.error("unknown pattern: " + name)
+
+    benchutils.install_tkinter(args.real_tk)
+    import tkinter
+    from tkinter import ttk
+
+    # the patterns get tk.tkinter and tk.ttk, so they work with both
+    tk = argparse.Namespace(tkinter=tkinter, ttk=ttk)
+
+    header = ['pattern', 'msg/s', 'p50 ms', 'p90 ms', 'p99 ms', 'max ms',
+              'idle CPU %']
+    print(('%-24s' + ' %10s' * (len(header) - 1)) % tuple(header))
+    for name in (args.patterns or PATTERNS):
+        row = run_pattern(tk, args, PATTERNS[name])
+        print(('%-24s' + ' %10.1f' * len(row)) % tuple([name] + row))
+
+
+if __name__ == '__main__':
+    main()
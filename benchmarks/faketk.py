@@ -0,0 +1,623 @@
+"""A fake tkinter for running tkinter code without a display.
+
+Only the event loop is real: after callbacks, after_idle callbacks and
+virtual events run at the right times, and mainloop() sleeps when there
+is nothing to do, just like with real Tk. Widgets don't draw anything,
+but they remember their options, and every configure is counted in
+root.stats so we can see how much work a program asks Tk to do.
+
+Use it like this before importing anything that imports tkinter:
+
+    import faketk
+    faketk.install()
+"""
+
+import collections
+import heapq
+import itertools
+import select
+import sys
+import threading
+import time
+import traceback
+import types
+
+
+_default_root = None
+DONT_WAIT = 2
+ALL_EVENTS = -3
+
+
+class TclError(Exception):
+    pass
+
+
+class CallWrapper:
+    """Like tkinter.CallWrapper, all callbacks go through this."""
+
+    def __init__(self, func, subst, widget):
+        self.func = func
+        self.subst = subst
+        self.widget = widget
+
+    def __call__(self, *args):
+        try:
+            if self.subst:
+                args = self.subst(*args)
+            return self.func(*args)
+        except SystemExit:
+            raise
+        except Exception:
+            traceback.print_exc()
+
+
+class Misc:
+
+    def __init__(self, master=None, **options):
+        if master is None:
+            master = _get_default_root()
+        self.master = master
+        self._root = master._root
+        self.tk = self._root.tk
+        self._options = {}
+        self._bindings = {}
+        self.children = {}
+        self._child_counts = collections.Counter()
+        self._manager = ''
+        self._manager_options = {}
+        self._propagate = {'pack': True, 'grid': True}
+        self._bindtags = None
+        self._destroyed = False
+        if master is not self:
+            # widget names are like '.!frame.!button2' in real tkinter
+            name = '!' + type(self).__name__.lower()
+            master._child_counts[name] += 1
+            if master._child_counts[name] > 1:
+                name += str(master._child_counts[name])
+            master.children[name] = self
+            self._name = name
+            self._w = master._w.rstrip('.') + '.' + name
+        self._root.stats['widgets'] += 1
+        self.configure(**options)
+
+    def __str__(self):
+        return self._w
+
+    def configure(self, cnf=None, **options):
+        if cnf:
+            options.update(cnf)
+        if options:
+            self._root.stats['configure'] += 1
+            self._options.update(options)
+
+    config = configure
+
+    def cget(self, key):
+        return self._options.get(key, '')
+
+    def __setitem__(self, key, value):
+        self.configure(**{key: value})
+
+    def __getitem__(self, key):
+        return self.cget(key)
+
+    def bind(self, sequence, func, add=None):
+        self._bindings[sequence] = func
+
+    def invoke(self):
+        # like clicking a button
+        command = self.cget('command')
+        if command:
+            return CallWrapper(command, None, self)()
+
+    def bind_class(self, className, sequence, func, add=None):
+        self._root._class_bindings.setdefault(className, {})[sequence] = func
+
+    def bindtags(self, tagList=None):
+        if tagList is None:
+            if self._bindtags is not None:
+                return self._bindtags
+            # like in real Tk, bindings of the toplevel run for the
+            # widgets in it too
+            toplevel = self.winfo_toplevel()
+            if toplevel is self:
+                return (self._w, type(self).__name__, 'all')
+            return (self._w, type(self).__name__, toplevel._w, 'all')
+        self._bindtags = tuple(tagList)
+
+    def winfo_toplevel(self):
+        widget = self
+        while not isinstance(widget, (Tk, Toplevel)):
+            widget = widget.master
+        return widget
+
+    def unbind(self, sequence, funcid=None):
+        self._bindings.pop(sequence, None)
+
+    def event_generate(self, sequence, when='now', **kwargs):
+        # when='tail' events are safe to generate from other threads,
+        # like with a real Tk that has thread support
+        self._root._add_event(self, sequence, when == 'now', kwargs)
+
+    def destroy(self):
+        self._root.stats['destroyed'] += 1
+        self._destroyed = True
+        for child in list(self.children.values()):
+            child.destroy()
+        if self.master.children.get(self._name) is self:
+            del self.master.children[self._name]
+
+    def after(self, ms, func=None, *args):
+        return self._root.after(ms, func, *args)
+
+    def after_idle(self, func, *args):
+        return self._root.after_idle(func, *args)
+
+    def after_cancel(self, id):
+        self._root.after_cancel(id)
+
+    def update(self):
+        self._root.update()
+
+    def update_idletasks(self):
+        self._root.update_idletasks()
+
+    def winfo_exists(self):
+        return not (self._destroyed or self._root._destroyed)
+
+    def wait_variable(self, variable):
+        # like in real tkinter, the event loop runs until the variable
+        # is set
+        writes = variable._writes
+        while variable._writes == writes and not self._root._destroyed:
+            self._root._run(self._root._get_ready(block=True))
+
+    # focus and grabs don't do anything
+    def _focus(self, *args, **kwargs):
+        pass
+
+    focus = focus_set = grab_set = grab_release = _focus
+
+    # widgets are 25 pixels tall unless they have a height option
+    def winfo_height(self):
+        return int(self._options.get('height') or 25)
+
+    winfo_reqheight = winfo_height
+
+    def winfo_width(self):
+        return int(self._options.get('width') or 100)
+
+    winfo_reqwidth = winfo_width
+
+    # geometry managers don't do anything, but they're counted, and the
+    # widgets remember their geometry manager and its options
+    def _geometry(self, *args, **kwargs):
+        self._root.stats['geometry'] += 1
+
+    def _make_manager(name, defaults):
+        def manage(self, cnf=None, **options):
+            self._root.stats['geometry'] += 1
+            if self._manager != name:
+                self._manager = name
+                self._manager_options = dict(defaults)
+            self._manager_options.update(cnf or {}, **options)
+        return manage
+
+    pack = pack_configure = _make_manager('pack', {
+        'anchor': 'center', 'expand': 0, 'fill': 'none', 'side': 'top'})
+    grid = grid_configure = _make_manager('grid', {'sticky': ''})
+    place = place_configure = _make_manager('place', {'anchor': 'nw'})
+    del _make_manager
+
+    def _forget(self):
+        self._root.stats['geometry'] += 1
+        self._manager = ''
+
+    pack_forget = grid_forget = place_forget = _forget
+
+    def winfo_manager(self):
+        return self._manager
+
+    def pack_info(self):
+        return dict(self._manager_options)
+
+    grid_info = place_info = pack_info
+    grid_columnconfigure = grid_rowconfigure = _geometry
+    columnconfigure = rowconfigure = _geometry
+
+    def _make_propagate(name):
+        def propagate(self, flag=None):
+            if flag is None:
+                return self._propagate[name]
+            self._root.stats['geometry'] += 1
+            self._propagate[name] = bool(flag)
+        return propagate
+
+    pack_propagate = _make_propagate('pack')
+    grid_propagate = _make_propagate('grid')
+    del _make_propagate
+
+
+class _TkApp:
+    """The fake of root.tk, for file handlers and dooneevent()."""
+
+    def __init__(self, root):
+        self._root = root
+        self._handlers = {}     # {fd: threading.Event that stops it}
+
+    def createfilehandler(self, fd, mask, func):
+        # a thread waits for the file and then runs func in the main
+        # loop, like Tk does with select() in the main loop
+        stop = threading.Event()
+        self._handlers[fd] = stop
+        ran = threading.Event()
+
+        def run_func():
+            try:
+                if not stop.is_set():
+                    CallWrapper(func, None, self._root)(fd, mask)
+            finally:
+                ran.set()
+
+        def thread_target():
+            while not stop.is_set():
+                readable, _, _ = select.select([fd], [], [], 0.1)
+                if readable and not stop.is_set():
+                    ran.clear()
+                    self._root._call_soon(run_func)
+                    while not (ran.wait(0.1) or stop.is_set()):
+                        pass
+
+        threading.Thread(target=thread_target, daemon=True).start()
+
+    def deletefilehandler(self, fd):
+        self._handlers.pop(fd).set()
+
+    def call(self, *args):
+        # Tcl commands don't do anything, but they're counted
+        self._root.stats['tcl calls'] += 1
+        return ''
+
+    def dooneevent(self, flags=0):
+        ready = self._root._get_ready(block=not (flags & DONT_WAIT))
+        self._root._run(ready)
+        return int(bool(ready))
+
+
+class Wm:
+    # window manager stuff doesn't do anything
+
+    def _wm(self, *args, **kwargs):
+        return ''
+
+    title = geometry = minsize = maxsize = resizable = transient = _wm
+    protocol = withdraw = deiconify = wait_window = _wm
+
+
+class Tk(Misc, Wm):
+
+    def __init__(self, **options):
+        global _default_root
+        self._root = self
+        self._w = '.'
+        self.master = None
+        self.stats = collections.Counter()
+        self._lock = threading.Lock()
+        self._condition = threading.Condition(self._lock)
+        self._timers = []            # heap of (deadline, id)
+        self._callbacks = {}         # {id: (func, args)}
+        self._idle = collections.deque()
+        self._events = collections.deque()
+        self._class_bindings = {}    # {tag: {sequence: func}}
+        self._ids = itertools.count()
+        self._quit = False
+        self._destroyed = False
+        self.tk = _TkApp(self)
+        if _default_root is None:
+            _default_root = self
+        Misc.__init__(self, self, **options)
+
+    def after(self, ms, func=None, *args):
+        if func is None:
+            time.sleep(ms / 1000)
+            return None
+
+        # real tkinter wraps the function like this too, so CallWrapper
+        # gets callit instead of func
+        def callit():
+            func(*args)
+
+        callit.__name__ = getattr(func, '__name__', type(func).__name__)
+        with self._condition:
+            id = 'after#%d' % next(self._ids)
+            self._callbacks[id] = (CallWrapper(callit, None, self), ())
+            if ms == 'idle':
+                self._idle.append(id)
+                self.stats['after_idle'] += 1
+            else:
+                heapq.heappush(self._timers,
+                               (time.perf_counter() + ms/1000, id))
+                self.stats['after'] += 1
+            self._condition.notify()
+        return id
+
+    def after_idle(self, func, *args):
+        return self.after('idle', func, *args)
+
+    def after_cancel(self, id):
+        with self._condition:
+            self._callbacks.pop(id, None)
+
+    def _call_soon(self, func, *args):
+        # like after(0, ...) but from any thread, for file handlers
+        with self._condition:
+            self._events.append((func, args))
+            self._condition.notify()
+
+    def _add_event(self, widget, sequence, run_now, fields):
+        if run_now:
+            self._run_event(widget, sequence, fields)
+            return
+        self._call_soon(self._run_event, widget, sequence, fields)
+
+    def _run_event(self, widget, sequence, fields):
+        event = types.SimpleNamespace(widget=widget, **fields)
+        for tag in widget.bindtags():
+            if tag == widget._w:
+                func = widget._bindings.get(sequence)
+            elif tag == widget.winfo_toplevel()._w:
+                func = widget.winfo_toplevel()._bindings.get(sequence)
+            else:
+                func = self._class_bindings.get(tag, {}).get(sequence)
+            if func is not None:
+                self.stats['events'] += 1
+                CallWrapper(func, None, widget)(event)
+
+    def _get_ready(self, block):
+        # returns a list of (func, args) to run, with the lock held so
+        # that threads can add callbacks while we wait
+        with self._condition:
+            while True:
+                if self._quit or self._destroyed:
+                    return []
+                ready = []
+                while self._events:
+                    ready.append(self._events.popleft())
+                now = time.perf_counter()
+                while self._timers and self._timers[0][0] <= now:
+                    deadline, id = heapq.heappop(self._timers)
+                    if id in self._callbacks:
+                        ready.append(self._callbacks.pop(id))
+                if not ready:
+                    while self._idle:
+                        id = self._idle.popleft()
+                        if id in self._callbacks:
+                            ready.append(self._callbacks.pop(id))
+                if ready or not block:
+                    return ready
+
+                if self._timers:
+                    self._condition.wait(self._timers[0][0] - now)
+                else:
+                    self._condition.wait()
+
+    def _run(self, ready):
+        for func, args in ready:
+            self.stats['callbacks'] += 1
+            func(*args)
+
+    def update_idletasks(self):
+        with self._condition:
+            ready = [self._callbacks.pop(id) for id in self._idle
+                     if id in self._callbacks]
+            self._idle.clear()
+        self._run(ready)
+
+    def update(self):
+        ready = self._get_ready(block=False)
+        while ready:
+            self._run(ready)
+            ready = self._get_ready(block=False)
+
+    def mainloop(self, n=0):
+        self._quit = False
+        while not (self._quit or self._destroyed):
+            self._run(self._get_ready(block=True))
+
+    def quit(self):
+        with self._condition:
+            self._quit = True
+            self._condition.notify()
+
+    def destroy(self):
+        global _default_root
+        with self._condition:
+            self._destroyed = True
+            self._condition.notify()
+        if _default_root is self:
+            _default_root = None
+
+    def winfo_exists(self):
+        return not self._destroyed
+
+
+def _get_default_root():
+    if _default_root is None:
+        return Tk()
+    return _default_root
+
+
+class Toplevel(Misc, Wm):
+    pass
+
+
+class PhotoImage:
+    """An image that knows its size but has no pixels.
+
+    The size of PNG files is read from the file, like Tk would do.
+    """
+
+    _names = itertools.count(1)
+
+    def __init__(self, name=None, cnf={}, master=None, **options):
+        if master is None:
+            master = _get_default_root()
+        self.tk = master.tk
+        self.name = name or 'pyimage%d' % next(self._names)
+        self._width = int(options.get('width', 0))
+        self._height = int(options.get('height', 0))
+        filename = options.get('file')
+        if filename is not None:
+            with open(filename, 'rb') as file:
+                header = file.read(24)
+            if header[:8] == b'\x89PNG\r\n\x1a\n':
+                self._width = int.from_bytes(header[16:20], 'big')
+                self._height = int.from_bytes(header[20:24], 'big')
+        master._root.stats['images'] += 1
+
+    def __str__(self):
+        return self.name
+
+    def width(self):
+        return self._width
+
+    def height(self):
+        return self._height
+
+    def subsample(self, x, y=''):
+        y = y or x
+        return PhotoImage(master=self.tk._root,
+                          width=-(-self._width // x),
+                          height=-(-self._height // y))
+
+
+class Scrollbar(Misc):
+
+    def set(self, first, last):
+        self._options['position'] = (float(first), float(last))
+
+    def get(self):
+        return self._options.get('position', (0.0, 1.0))
+
+
+class Entry(Misc):
+
+    def get(self):
+        return self._options.get('text', '')
+
+    def insert(self, index, text):
+        old = self.get()
+        index = len(old) if index == 'end' else int(index)
+        self._options['text'] = old[:index] + text + old[index:]
+
+    def delete(self, first, last=None):
+        old = self.get()
+        first = len(old) if first == 'end' else int(first)
+        if last is None:
+            last = first + 1
+        elif last == 'end':
+            last = len(old)
+        self._options['text'] = old[:first] + old[int(last):]
+
+    def select_range(self, start, end):
+        pass
+
+
+class Variable:
+
+    def __init__(self, master=None, value=None):
+        self._value = value
+        self._writes = 0        # for wait_variable()
+
+    def get(self):
+        return self._value
+
+    def set(self, value):
+        self._value = value
+        self._writes += 1
+
+
+class StringVar(Variable):
+
+    def __init__(self, master=None, value=''):
+        Variable.__init__(self, master, value)
+
+
+class BooleanVar(Variable):
+
+    def __init__(self, master=None, value=False):
+        Variable.__init__(self, master, value)
+
+
+def _make_widget_class(name):
+    return type(name, (Misc,), {})
+
+
+def _make_module(name, widget_names, extra=()):
+    module = types.ModuleType(name)
+    for widget_name in widget_names:
+        setattr(module, widget_name, _make_widget_class(widget_name))
+    if widget_names:
+        module.Scrollbar = type('Scrollbar', (Scrollbar,), {})
+        module.Entry = type('Entry', (Entry,), {})
+    for key, value in extra:
+        setattr(module, key, value)
+
+    # other widgets are created when they're needed
+    def __getattr__(attribute):
+        if attribute[:1].isupper():
+            cls = _make_widget_class(attribute)
+            setattr(module, attribute, cls)
+            return cls
+        raise AttributeError(attribute)
+
+    module.__getattr__ = __getattr__
+    return module
+
+
+def _dialog_function(*args, **kwargs):
+    # like the user closed the dialog right away
+    return None
+
+
+def _make_dialog_module(name, function_names):
+    return _make_module(name, [], [(function_name, _dialog_function)
+                                   for function_name in function_names])
+
+
+_WIDGETS = ['Frame', 'Label', 'Button', 'LabelFrame', 'Checkbutton',
+            'Radiobutton', 'Canvas', 'Listbox', 'Text']
+
+
+def install():
+    """Make 'import tkinter' import this instead of the real tkinter."""
+    tkinter = _make_module('tkinter', _WIDGETS, [
+        ('Tk', Tk), ('Toplevel', Toplevel), ('Misc', Misc),
+        ('CallWrapper', CallWrapper),
+        ('TclError', TclError), ('Variable', Variable),
+        ('StringVar', StringVar), ('BooleanVar', BooleanVar),
+        ('PhotoImage', PhotoImage),
+        ('TkVersion', 8.6),
+        ('READABLE', 2), ('WRITABLE', 4), ('EXCEPTION', 8),
+    ])
+    submodules = {
+        'ttk': _make_module('tkinter.ttk', _WIDGETS),
+        'messagebox': _make_dialog_module('tkinter.messagebox', [
+            'showinfo', 'showwarning', 'showerror', 'askquestion',
+            'askokcancel', 'askyesno', 'askyesnocancel', 'askretrycancel']),
+        'filedialog': _make_dialog_module('tkinter.filedialog', [
+            'askopenfilename', 'askopenfilenames', 'asksaveasfilename',
+            'askdirectory', 'askopenfile', 'asksaveasfile']),
+        'simpledialog': _make_dialog_module('tkinter.simpledialog', [
+            'askfloat', 'askinteger', 'askstring']),
+        'colorchooser': _make_dialog_module('tkinter.colorchooser', [
+            'askcolor']),
+    }
+    sys.modules['tkinter'] = tkinter
+    sys.modules['_tkinter'] = _make_module('_tkinter', [], [
+        ('TclError', TclError), ('DONT_WAIT', DONT_WAIT),
+        ('ALL_EVENTS', ALL_EVENTS),
+    ])
+    for name, module in submodules.items():
+        setattr(tkinter, name, module)
+        sys.modules['tkinter.' + name] = module
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""Measure how long the imports of each example take.
+
+This runs the top-level import statements of every example in a new
+Python process with -X importtime, so it doesn't need a display, and
+the examples don't actually run. Each example is measured several
+times, and the fastest time is used because the slower times are
+usually slow because of something else running on the same computer.
+For example:
+
+    $ python3 benchmarks/import-time.py
+    $ python3 benchmarks/import-time.py --json new.json --compare old.json
+
+The --json file can be given to --compare later, e.g. with a different
+Python version, and the differences are shown in the table.
+"""
+
+import argparse
+import ast
+import glob
+import json
+import os
+import subprocess
+import sys
+
+_EXAMPLES = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         os.pardir, 'examples')
+
+
+def get_import_code(filename):
+    """Return the top-level imports of a file as a string of code."""
+    with open(filename, 'r', encoding='utf-8') as file:
+        source = file.read()
+    return '\n'.join(ast.get_source_segment(source, node)
+                     for node in ast.parse(source, filename).body
+                     if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+
+def run_importtime(code, directory):
+    """Return {module name: microseconds} for modules imported by code.
+
+    Modules imported by other modules are included in the times of the
+    modules that imported them.
+    """
+    # without .pyc files, the time of compiling the examples' own modules
+    # would be included every time
+    env = dict(os.environ)
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    output = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=directory, env=env, stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE, universal_newlines=True, check=True).stderr
+
+    result = {}
+    for line in output.splitlines():
+        # the lines look like this, and the indentation means that the
+        # module was imported by the module before it:
+        # import time:  self [us] | cumulative |     imported package
+        if not line.startswith('import time:'):
+            continue
+        self_time, cumulative, name = line[len('import time:'):].split('|')
+        if cumulative.strip().isdigit() and not name[1:].startswith(' '):
+            result[name.strip()] = int(cumulative)
+    return result
+
+
+def measure(filename, startup_modules):
+    """Like run_importtime(), but for the imports of an example file."""
+    times = run_importtime(get_import_code(filename),
+                           os.path.dirname(os.path.abspath(filename)))
+    # python imports these when it starts, even without any code to run
+    return {name: microseconds for name, microseconds in times.items()
+            if name not in startup_modules}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n\n')[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'examples', nargs='*', metavar='EXAMPLE',
+        help="example files (default: everything in examples/)")
+    parser.add_argument(
+        '--repeat', type=int, default=5,
+        help="number of times to measure each example "
+             "(default: %(default)s)")
+    parser.add_argument(
+        '--json', metavar='FILE',
+        help="save the results to a JSON file")
+    parser.add_argument(
+        '--compare', metavar='FILE',
+        help="compare with results saved with --json earlier")
+    args = parser.parse_args()
+
+    filenames = args.examples or sorted(
+        glob.glob(os.path.join(_EXAMPLES, '*', '*.py')))
+    old_results = {}
+    if args.compare is not None:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            old_results = json.load(file)
+
+    startup_modules = run_importtime('', _EXAMPLES).keys()
+    results = {}
+    print('%-45s %10s %10s  %s' % ('example', 'ms', 'change',
+                                   'slowest import'))
+    for filename in filenames:
+        name = os.path.relpath(filename, _EXAMPLES).replace(os.sep, '/')
+        timings = [measure(filename, startup_modules)
+                   for i in range(args.repeat)]
+        total = min(sum(timing.values()) for timing in timings) / 1000
+        slowest = max(timings[0], key=timings[0].get, default='')
+        results[name] = total
+
+        change = ''
+        if name in old_results:
+            change = '%+.1f' % (total - old_results[name])
+        print('%-45s %10.1f %10s  %s' % (name, total, change, slowest))
+
+    if args.json is not None:
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(results, file, indent=4, sort_keys=True)
+            file.write('\n')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Compare the include scanner in includes.py with the old regex.
+
+This generates big markdown files in a temporary directory and runs both
+implementations on them. Run this from anywhere, e.g.
+
+    $ python3 benchmarks/include-scanner.py --megabytes 4
+"""
+
+import argparse
+import functools
+import os
+import re
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir))
+import includes     # noqa
+
+
+# this is how includes.py used to do it
+_INCLUDE_REGEX = (
+    r'^\[include\]: # \((.*)\)\n'
+    r'```.*\n'
+    r'([\S\s]*?)'
+    r'^```$'
+)
+
+
+def replacer(chapter, match):
+    path = os.path.join('examples', chapter, match.group(1))
+    with open(path, 'r') as file:
+        file_content = file.read()
+
+    if match.group(2) == file_content:
+        return match.group(0)
+
+    start = match.start(2) - match.start(0)
+    end = match.end(2) - match.start(0)
+    return match.group(0)[:start] + file_content + match.group(0)[end:]
+
+
+def regex_update_includes(chapter, content):
+    the_replacer = functools.partial(replacer, chapter)
+    return re.sub(_INCLUDE_REGEX, the_replacer, content, flags=re.MULTILINE)
+
+
+EXAMPLE = '''\
+import tkinter
+from tkinter import ttk
+
+
+root = tkinter.Tk()
+ttk.Label(root, text="Hello World!").pack()
+root.mainloop()
+'''
+SECTION = '''\
+## Some section
+
+Here's some text that explains the example. It has a few lines, just
+like the real chapters of the tutorial.
+
+```python
+>>> print("this is not an include")
+this is not an include
+```
+
+[include]: # (example.py)
+```python
+%s```
+
+'''
+
+
+def make_markdown(size, unterminated):
+    if unterminated:
+        # every include is missing the closing ```, so the regex looks
+        # for it all the way to the end of the file for every include
+        section = '[include]: # (example.py)\n```python\n' + 'text\n' * 20
+    else:
+        section = SECTION % EXAMPLE
+    return section * (size // len(section) + 1)
+
+
+def run(function, content):
+    try:
+        function('bench', content)
+    except includes.IncludeError:
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--megabytes', type=int, default=4)
+    # the regex takes quadratic time with unterminated code blocks, so
+    # this can't be very big
+    parser.add_argument('--unterminated-kilobytes', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        os.chdir(tempdir)
+        os.makedirs(os.path.join('examples', 'bench'))
+        with open(os.path.join('examples', 'bench', 'example.py'), 'w') as f:
+            f.write(EXAMPLE)
+
+        cases = [('valid', args.megabytes * 1024 * 1024, False),
+                 ('unterminated', args.unterminated_kilobytes * 1024, True)]
+        for name, size, unterminated in cases:
+            content = make_markdown(size, unterminated)
+            print("%s markdown, %d KB:" % (name, len(content) // 1024))
+            if not unterminated:
+                assert (includes.update_includes('bench', content) ==
+                        regex_update_includes('bench', content))
+
+            for label, function in [('regex', regex_update_includes),
+                                    ('scanner', includes.update_includes)]:
+                seconds = min(timeit.repeat(
+                    functools.partial(run, function, content),
+                    number=1, repeat=args.repeat))
+                print("  %-8s %.3f seconds" % (label, seconds))
+        os.chdir(os.sep)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Compare changing labels directly with tkupdater.Updater.
+
+Lots of labels get several new texts between two frames, like in
+examples/event-loop-stuff/telemetry.py. The direct way sets each text
+right away with label['text'] = ..., and the updater does only the
+last change of each label when the main loop is idle. By default this
+uses faketk.py, so no display is needed, and --real-tk uses the real
+tkinter instead. For example:
+
+    $ python3 benchmarks/label-updates.py
+    $ python3 benchmarks/label-updates.py --real-tk --labels 500
+
+The time is the total time of the callbacks that change the labels and
+the updater's after_idle callbacks, per frame.
+"""
+
+import argparse
+import random
+import time
+
+import benchutils
+
+benchutils.add_example_dir('event-loop-stuff')
+
+
+def run(tkinter, args, use_updater):
+    from tkupdater import Updater
+
+    root = tkinter.Tk()
+    labels = [tkinter.Label(root) for i in range(args.labels)]
+    updater = Updater(root)
+    random.seed(0)
+    frames = []
+
+    def frame_callback():
+        start = time.perf_counter()
+        for i in range(args.labels * args.changes):
+            label = random.choice(labels)
+            text = str(random.randrange(args.values))
+            if use_updater:
+                updater.set(label, text)
+            else:
+                label['text'] = text
+        root.update_idletasks()     # runs the updater's after_idle
+        frames.append(time.perf_counter() - start)
+
+        if len(frames) < args.frames:
+            root.after(1000 // 50, frame_callback)
+        else:
+            root.destroy()
+
+    root.after_idle(frame_callback)
+    root.mainloop()
+
+    configures = updater.configures if use_updater else len(frames) * (
+        args.labels * args.changes)
+    return [1000 * sum(frames) / len(frames), configures / len(frames)]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n\n')[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    benchutils.add_real_tk_option(parser)
+    parser.add_argument(
+        '--labels', type=int, default=200,
+        help="number of labels (default: %(default)s)")
+    parser.add_argument(
+        '--changes', type=int, default=5,
+        help="average number of changes per label per frame "
+             "(default: %(default)s)")
+    parser.add_argument(
+        '--values', type=int, default=10,
+        help="number of different texts that a label can have "
+             "(default: %(default)s)")
+    parser.add_argument(
+        '--frames', type=int, default=50,
+        help="number of frames, there are 50 frames per second "
+             "(default: %(default)s)")
+    args = parser.parse_args()
+
+    benchutils.install_tkinter(args.real_tk)
+    import tkinter
+
+    print('%-10s %14s %18s' % ('way', 'ms per frame', 'configures/frame'))
+    for name, use_updater in [('direct', False), ('updater', True)]:
+        row = run(tkinter, args, use_updater)
+        print('%-10s %14.2f %18.1f' % tuple([name] + row))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""Compare pack, grid and place with lots of widgets.
+
+Each layout puts some number of labels into a window. The grid and
+place layouts arrange them like a table that stretches with the window,
+like calculator.py in the geometry manager chapter, and build_grid is
+like grid but with tkgrid.build_grid(). The nested layout packs frames
+that contain 10 gridded labels each, like frames.py does with the
+calculator. Each case runs in a new process, so that the peak memory
+usage of one case doesn't affect the others.
+
+This needs the real tkinter and a display, because faketk.py doesn't
+compute layouts. For example:
+
+    $ python3 benchmarks/layout.py
+    $ python3 benchmarks/layout.py grid place --counts 100 1000
+
+The create time includes creating the widgets and the geometry manager
+calls, the layout time is the first update_idletasks() that computes
+the layout, and the resize time is the average time of changing the
+window size and waiting until Tk has handled it.
+"""
+
+import argparse
+import math
+import subprocess
+import time
+
+import benchutils
+
+benchutils.add_example_dir('geometry-managers')
+
+# {name: function}, see @layout
+LAYOUTS = {}
+
+
+def layout(name):
+    def decorator(function):
+        LAYOUTS[name] = function
+        return function
+    return decorator
+
+
+def make_labels(parent, numbers):
+    from tkinter import ttk
+    return [ttk.Label(parent, text=str(number)) for number in numbers]
+
+
+@layout('pack')
+def layout_pack(frame, count):
+    for label in make_labels(frame, range(count)):
+        label.pack(fill='x')
+
+
+def table_size(count):
+    columns = math.ceil(math.sqrt(count))
+    return (columns, math.ceil(count / columns))
+
+
+@layout('grid')
+def layout_grid(frame, count):
+    columns, rows = table_size(count)
+    for index, label in enumerate(make_labels(frame, range(count))):
+        label.grid(row=index // columns, column=index % columns,
+                   sticky='nswe')
+    for x in range(columns):
+        frame.grid_columnconfigure(x, weight=1)
+    for y in range(rows):
+        frame.grid_rowconfigure(y, weight=1)
+
+
+@layout('build_grid')
+def layout_build_grid(frame, count):
+    from tkgrid import build_grid
+
+    columns, rows = table_size(count)
+    numbers = list(range(count))
+    build_grid(frame, [numbers[start:start+columns]
+                       for start in range(0, count, columns)],
+               lambda parent, number: make_labels(parent, [number])[0],
+               stretch=True, sticky='nswe')
+
+
+@layout('place')
+def layout_place(frame, count):
+    columns, rows = table_size(count)
+    for index, label in enumerate(make_labels(frame, range(count))):
+        label.place(relx=(index % columns) / columns,
+                    rely=(index // columns) / rows,
+                    relwidth=1 / columns, relheight=1 / rows)
+
+
+@layout('nested')
+def layout_nested(frame, count):
+    from tkinter import ttk
+
+    for start in range(0, count, 10):
+        inner_frame = ttk.Frame(frame)
+        inner_frame.pack(side='top', fill='both', expand=True)
+        numbers = range(start, min(start + 10, count))
+        for index, label in enumerate(make_labels(inner_frame, numbers)):
+            label.grid(row=0, column=index, sticky='nswe')
+            inner_frame.grid_columnconfigure(index, weight=1)
+        inner_frame.grid_rowconfigure(0, weight=1)
+
+
+def run_case(layout_name, count, resizes):
+    """Run one case in this process and print the results."""
+    import tkinter
+    from tkinter import ttk
+
+    root = tkinter.Tk()
+    root.geometry('800x600')
+    frame = ttk.Frame(root)
+    frame.pack(fill='both', expand=True)
+
+    start = time.perf_counter()
+    LAYOUTS[layout_name](frame, count)
+    create_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    root.update_idletasks()
+    layout_time = time.perf_counter() - start
+
+    # the window must be visible before resizing does anything
+    root.update()
+    start = time.perf_counter()
+    for number in range(resizes):
+        if number % 2 == 0:
+            root.geometry('600x400')
+        else:
+            root.geometry('800x600')
+        root.update()
+    resize_time = (time.perf_counter() - start) / resizes
+
+    root.destroy()
+    print(create_time * 1000, layout_time * 1000, resize_time * 1000,
+          benchutils.peak_rss_megabytes())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n\n')[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'layouts', nargs='*', metavar='LAYOUT',
+        help="layouts to run (default: all), one of: " + ', '.join(LAYOUTS))
+    parser.add_argument(
+        '--counts', type=int, nargs='+', default=[10, 100, 1000, 10000],
+        help="numbers of widgets to try (default: %(default)s)")
+    parser.add_argument(
+        '--resizes', type=int, default=20,
+        help="number of times to resize the window (default: %(default)s)")
+    benchutils.add_subprocess_option(parser, 'LAYOUT', 'COUNT')
+    args = parser.parse_args()
+
+    if args.subprocess is not None:
+        layout_name, count = args.subprocess
+        run_case(layout_name, int(count), args.resizes)
+        return
+
+    for name in args.layouts:
+        if name not in LAYOUTS:
+            parser.error("unknown layout: " + name)
+
+    header = ['layout', 'widgets', 'create ms', 'layout ms', 'resize ms',
+              'peak RSS MB']
+    print(('%-10s' + ' %11s' * (len(header) - 1)) % tuple(header))
+    for count in args.counts:
+        for name in (args.layouts or LAYOUTS):
+            output = subprocess.check_output(
+                benchutils.subprocess_command(
+                    __file__, [name, count], ['--resizes', str(args.resizes)]),
+                universal_newlines=True)
+            row = list(map(float, output.split()))
+            print(('%-10s %11d' + ' %11.1f' * len(row)) % tuple(
+                [name, count] + row))
+
+
+if __name__ == '__main__':
+    main()
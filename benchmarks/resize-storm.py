@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Resize a window with lots of stretchy widgets many times quickly.
+
+This is like a user dragging the corner of
+examples/geometry-managers/dashboard.py, with and without
+tkresize.ResizeThrottler. A callback that should run once per frame
+(every 16 milliseconds) counts how many frames were dropped because the
+main loop was busy laying out the widgets. This needs the real tkinter
+and a display, because resizing a window does nothing with faketk.py.
+For example:
+
+    $ python3 benchmarks/resize-storm.py
+    $ python3 benchmarks/resize-storm.py --size 40 --interval 5
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir, 'examples', 'geometry-managers'))
+
+FRAME_TIME = 0.016
+
+
+def run(tkinter, ttk, args, throttle):
+    from tkgrid import build_grid
+    from tkresize import ResizeThrottler
+
+    root = tkinter.Tk()
+    root.geometry('800x600')
+    big_frame = ttk.Frame(root)
+    big_frame.pack(fill='both', expand=True)
+    rows = [[y*args.size + x for x in range(args.size)]
+            for y in range(args.size)]
+    build_grid(big_frame, rows,
+               lambda parent, number: ttk.Button(parent, text=str(number)),
+               stretch=True, sticky='nswe')
+    if throttle:
+        ResizeThrottler(root, big_frame, args.delay)
+    root.update()
+
+    relayouts = []
+    big_frame.bind('<Configure>', lambda event: relayouts.append(1),
+                   add=True)
+
+    ticks = []
+
+    def tick():
+        ticks.append(time.perf_counter())
+        root.after(round(FRAME_TIME * 1000), tick)
+
+    steps = []
+
+    def resize():
+        step = len(steps)
+        steps.append(step)
+        if step < args.steps:
+            # the window grows and shrinks like when dragging the corner
+            width = 800 + 200 - abs(step % 400 - 200)
+            root.geometry('%dx%d' % (width, width * 3 // 4))
+            root.after(args.interval, resize)
+        else:
+            # wait for the throttler to lay out the frame
+            root.after(args.delay + 200, root.destroy)
+
+    start = time.perf_counter()
+    tick()
+    resize()
+    root.mainloop()
+    elapsed = time.perf_counter() - start
+
+    dropped = 0
+    for before, after in zip(ticks, ticks[1:]):
+        dropped += max(0, round((after - before) / FRAME_TIME) - 1)
+    return [elapsed, len(ticks), dropped, len(relayouts)]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n\n')[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--size', type=int, default=20,
+        help="the buttons are in a SIZE x SIZE grid (default: %(default)s)")
+    parser.add_argument(
+        '--steps', type=int, default=200,
+        help="number of times to resize the window (default: %(default)s)")
+    parser.add_argument(
+        '--interval', type=int, default=10,
+        help="milliseconds between resizes (default: %(default)s)")
+    parser.add_argument(
+        '--delay', type=int, default=100,
+        help="delay of the throttler in milliseconds (default: %(default)s)")
+    args = parser.parse_args()
+
+    import tkinter
+    from tkinter import ttk
+
+    print('%-12s %10s %8s %8s %10s' % ('way', 'seconds', 'frames',
+                                       'dropped', 'relayouts'))
+    for name, throttle in [('direct', False), ('throttled', True)]:
+        elapsed, frames, dropped, relayouts = run(tkinter, ttk, args,
+                                                  throttle)
+        print('%-12s %10.2f %8d %8d %10d' % (name, elapsed, frames, dropped,
+                                             relayouts))
+
+
+if __name__ == '__main__':
+    main()
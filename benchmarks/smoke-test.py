@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""Run every example and check that it doesn't crash.
+
+Each example runs in its own Python process, several of them at the
+same time. By default the examples use faketk.py, so no display is
+needed, and --real-tk uses the real tkinter instead. Every root window
+is destroyed after --run-time seconds, so the examples stop by
+themselves, and dialogs return None right away with faketk. For
+example:
+
+    $ python3 benchmarks/smoke-test.py
+    $ python3 benchmarks/smoke-test.py --json report.json examples/dialogs/*.py
+
+The startup time is the time from starting to run the example to the
+main loop running for the first time, and it includes the imports.
+The JSON report can be compared with a report from a different Python
+or Tk version to find examples that got slower. The times are more
+accurate with --jobs 1, because then the examples don't slow down each
+other.
+"""
+
+import argparse
+import concurrent.futures
+import glob
+import json
+import os
+import platform
+import runpy
+import subprocess
+import sys
+import time
+
+import benchutils
+
+# the example process prints this before its results
+_RESULT_PREFIX = 'smoke-test result: '
+
+
+def run_example(filename, run_time, real_tk):
+    """Run an example in this process and print the results."""
+    benchutils.install_tkinter(real_tk)
+    import tkinter
+
+    result = {'startup_ms': None}
+    start = time.perf_counter()
+
+    def on_first_idle():
+        if result['startup_ms'] is None:
+            result['startup_ms'] = (time.perf_counter() - start) * 1000
+
+    # every root window runs for a while, and then it goes away like the
+    # user closed it
+    original_init = tkinter.Tk.__init__
+
+    def __init__(self, *args, **kwargs):
+        original_init(self, *args, **kwargs)
+        self.after_idle(on_first_idle)
+        self.after(round(run_time * 1000), self.destroy)
+
+    tkinter.Tk.__init__ = __init__
+
+    filename = os.path.abspath(filename)
+    directory = os.path.dirname(filename)
+    os.chdir(directory)
+    sys.path.insert(0, directory)
+    sys.argv = [filename]
+    runpy.run_path(filename, run_name='__main__')
+
+    result['run_ms'] = (time.perf_counter() - start) * 1000
+    result['peak_rss_mb'] = benchutils.peak_rss_megabytes()
+    print(_RESULT_PREFIX + json.dumps(result))
+
+    # some examples start threads that would keep running for a long time
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)
+
+
+def run_example_process(filename, args):
+    """Run an example in a new process and return a dict of results."""
+    options = ['--run-time', str(args.run_time)]
+    if args.real_tk:
+        options.append('--real-tk')
+    command = benchutils.subprocess_command(__file__, [filename], options)
+
+    try:
+        process = subprocess.run(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            universal_newlines=True, timeout=args.timeout)
+    except subprocess.TimeoutExpired:
+        return {'status': 'timeout'}
+
+    result = {}
+    for line in process.stdout.splitlines():
+        if line.startswith(_RESULT_PREFIX):
+            result = json.loads(line[len(_RESULT_PREFIX):])
+
+    # faketk and tkinter print tracebacks of callbacks without crashing
+    if process.returncode != 0 or not result or 'Traceback' in process.stderr:
+        result['status'] = 'error'
+        result['error'] = process.stderr.strip().splitlines()[-1:]
+    else:
+        result['status'] = 'ok'
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n\n')[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        'examples', nargs='*', metavar='EXAMPLE',
+        help="example files (default: everything in examples/)")
+    benchutils.add_real_tk_option(parser)
+    parser.add_argument(
+        '--run-time', type=float, default=0.5,
+        help="seconds to run each root window for (default: %(default)s)")
+    parser.add_argument(
+        '--timeout', type=float, default=30,
+        help="seconds to wait for an example to exit "
+             "(default: %(default)s)")
+    # the examples spend most of the time waiting in the main loop, so
+    # running more of them than there are CPUs is fine
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=8,
+        help="number of examples to run at the same time "
+             "(default: %(default)s)")
+    parser.add_argument(
+        '--json', metavar='FILE',
+        help="save a report to a JSON file")
+    benchutils.add_subprocess_option(parser, 'EXAMPLE')
+    args = parser.parse_args()
+
+    if args.subprocess is not None:
+        run_example(args.subprocess[0], args.run_time, args.real_tk)
+        return
+
+    filenames = args.examples or sorted(
+        glob.glob(os.path.join(benchutils.EXAMPLES, '*', '*.py')))
+    names = [
+        os.path.relpath(filename, benchutils.EXAMPLES).replace(os.sep, '/')
+        for filename in filenames]
+
+    with concurrent.futures.ThreadPoolExecutor(args.jobs) as executor:
+        results = list(executor.map(
+            lambda filename: run_example_process(filename, args), filenames))
+
+    print('%-45s %8s %11s %10s' % ('example', 'status', 'startup ms',
+                                   'peak MB'))
+    failed = 0
+    for name, result in zip(names, results):
+        # examples that don't create a root window have no startup time
+        startup = peak = '-'
+        if result.get('startup_ms') is not None:
+            startup = '%.1f' % result['startup_ms']
+        if 'peak_rss_mb' in result:
+            peak = '%.1f' % result['peak_rss_mb']
+        print('%-45s %8s %11s %10s' % (name, result['status'], startup, peak))
+        for line in result.get('error', []):
+            print('    ' + line)
+        if result['status'] != 'ok':
+            failed += 1
+
+    if args.json is not None:
+        report = {
+            'python': platform.python_version(),
+            'tk': 'real' if args.real_tk else 'fake',
+            'examples': dict(zip(names, results)),
+        }
+        with open(args.json, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=4, sort_keys=True)
+            file.write('\n')
+
+    if failed:
+        print("%d of %d examples failed" % (failed, len(results)))
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
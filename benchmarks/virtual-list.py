@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Compare creating lots of buttons with examples/buttons/virtuallist.py.
+
+The naive way creates a button for every row like many-buttons.py does,
+and VirtualList creates only the buttons that fit in the window. Each
+case runs in a new process, so that the peak memory usage of one case
+doesn't affect the others. By default this uses faketk.py, so no display
+is needed and the memory usage is only Python's part of it, and
+--real-tk uses the real tkinter instead. For example:
+
+    $ python3 benchmarks/virtual-list.py
+    $ python3 benchmarks/virtual-list.py --real-tk --counts 1000 10000
+
+The creation time is the time from creating the first button to the
+window being ready to show, i.e. after update_idletasks().
+"""
+
+import argparse
+import subprocess
+import time
+
+import benchutils
+
+benchutils.add_example_dir('buttons')
+
+
+def make_row(parent):
+    from tkinter import ttk
+    return ttk.Button(parent)
+
+
+def update_row(button, index):
+    button['text'] = "Hello %d" % (index + 1)
+
+
+def create_naive(frame, count):
+    from tkinter import ttk
+    for index in range(count):
+        button = ttk.Button(frame, text="Hello %d" % (index + 1))
+        button.pack()
+
+
+def create_virtual(frame, count):
+    from virtuallist import VirtualList
+    virtual_list = VirtualList(frame, count, make_row, update_row)
+    virtual_list.pack(fill='both', expand=True)
+
+
+CASES = {'naive': create_naive, 'virtual': create_virtual}
+
+
+def run_case(case, count, real_tk):
+    """Run one case in this process and print the results."""
+    benchutils.install_tkinter(real_tk)
+    import tkinter
+
+    root = tkinter.Tk()
+    frame = tkinter.Frame(root)
+    frame.pack(fill='both', expand=True)
+
+    start = time.perf_counter()
+    CASES[case](frame, count)
+    root.update_idletasks()
+    elapsed = time.perf_counter() - start
+
+    root.destroy()
+    print(elapsed * 1000, benchutils.peak_rss_megabytes())
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.split('\n\n')[0],
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    benchutils.add_real_tk_option(parser)
+    parser.add_argument(
+        '--counts', type=int, nargs='+', default=[1000, 10000, 100000],
+        help="numbers of rows to try (default: %(default)s)")
+    benchutils.add_subprocess_option(parser, 'CASE', 'COUNT')
+    args = parser.parse_args()
+
+    if args.subprocess is not None:
+        case, count = args.subprocess
+        run_case(case, int(count), args.real_tk)
+        return
+
+    print('%-10s %10s %12s %14s' % ('case', 'rows', 'create ms',
+                                    'peak RSS MB'))
+    for count in args.counts:
+        for case in CASES:
+            command = benchutils.subprocess_command(
+                __file__, [case, count], ['--real-tk'] if args.real_tk else [])
+            output = subprocess.check_output(command, universal_newlines=True)
+            milliseconds, megabytes = map(float, output.split())
+            print('%-10s %10d %12.1f %14.1f' % (case, count, milliseconds,
+                                                megabytes))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,38 @@
+import os
+import tkinter
+from tkinter import ttk
+
+from imagecache import ImageCache
+
+# the images of this tutorial are in the images directory
+IMAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         os.pardir, os.pardir, 'images')
+
+
+def print_hello():
+    print("hello")
+
+
+root = tkinter.Tk()
+big_frame = ttk.Frame(root)
+big_frame.pack(fill='both', expand=True)
+
+images = ImageCache()
+toolbar = ttk.Frame(big_frame)
+toolbar.pack(fill='x')
+
+for number in range(1, 21):
+    if number % 2 == 0:
+        filename = os.path.join(IMAGE_DIR, 'tk-ttk.png')
+    else:
+        filename = os.path.join(IMAGE_DIR, 'ttk-missing-big-frame.png')
+
+    # the cache loads the images only once, and the 20 buttons use the
+    # same 2 images
+    icon = images.get(filename, subsample=4)
+    button = ttk.Button(toolbar, text="Hello %d" % number, image=icon,
+                        compound='top', command=print_hello)
+    button.grid(row=(number - 1) // 10, column=(number - 1) % 10)
+
+print(images.report())
+root.mainloop()
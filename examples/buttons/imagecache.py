@@ -0,0 +1,75 @@
+import collections
+import os
+import tkinter
+
+
+class ImageCache:
+    """Load each image only once and use it in many widgets.
+
+    Tkinter deletes an image when the PhotoImage object is garbage
+    collected, even if a widget is still showing it, so programs need
+    to keep a reference to every image they use. Creating a new
+    PhotoImage for each widget is an easy way to do that, but then the
+    same image is in memory many times. The cache keeps one PhotoImage
+    for each file and gives it to every widget that needs it.
+
+    When the images take more than max_bytes of memory, the images
+    that haven't been needed for the longest time are removed from the
+    cache, but only if no widget is using them. Tk stores 4 bytes for
+    each pixel, so that's what the sizes are based on.
+    """
+
+    def __init__(self, max_bytes=10*1024*1024, master=None):
+        self.max_bytes = max_bytes
+        self.master = master
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._images = collections.OrderedDict()   # {key: PhotoImage}
+        self._total_bytes = 0
+
+    def get(self, filename, subsample=1):
+        """Return a PhotoImage of an image file.
+
+        With subsample=2, every second pixel is used, and the image is
+        half as wide and half as tall as the file. This is handy for
+        making small icons from big images.
+        """
+        key = (os.path.abspath(filename), subsample)
+        try:
+            image = self._images[key]
+        except KeyError:
+            self.misses += 1
+            image = tkinter.PhotoImage(file=filename, master=self.master)
+            if subsample != 1:
+                image = image.subsample(subsample)
+            self._images[key] = image
+            self._total_bytes += self._size(image)
+            self._evict(keep=key)
+        else:
+            self.hits += 1
+            self._images.move_to_end(key)     # most recently used
+        return image
+
+    def _size(self, image):
+        return image.width() * image.height() * 4
+
+    def _in_use(self, image):
+        # this tells whether any widget is showing the image
+        return bool(image.tk.call('image', 'inuse', image))
+
+    def _evict(self, keep):
+        # the least recently used images are first, and the image that
+        # was just loaded isn't used by any widgets yet
+        for key, image in list(self._images.items()):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if key != keep and not self._in_use(image):
+                del self._images[key]
+                self._total_bytes -= self._size(image)
+                self.evictions += 1
+
+    def report(self):
+        return '%d images, %d KiB, %d hits, %d misses, %d evictions' % (
+            len(self._images), self._total_bytes // 1024, self.hits,
+            self.misses, self.evictions)
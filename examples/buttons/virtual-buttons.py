@@ -0,0 +1,30 @@
+import tkinter
+from tkinter import ttk
+
+from virtuallist import VirtualList
+
+
+def print_hello_number(number):
+    print("hello", number)
+
+
+def make_row(parent):
+    button = ttk.Button(parent)
+    button['command'] = lambda: print_hello_number(button.number)
+    return button
+
+
+def update_row(button, index):
+    button.number = index + 1
+    button['text'] = "Hello %d" % button.number
+
+
+root = tkinter.Tk()
+big_frame = ttk.Frame(root)
+big_frame.pack(fill='both', expand=True)
+
+# this creates only the buttons that fit in the window
+virtual_list = VirtualList(big_frame, 100000, make_row, update_row)
+virtual_list.pack(fill='both', expand=True)
+
+root.mainloop()
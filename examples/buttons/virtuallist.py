@@ -0,0 +1,99 @@
+from tkinter import ttk
+
+
+class VirtualList(ttk.Frame):
+    """A scrollable list of widgets that only creates the visible rows.
+
+    Creating 100000 buttons takes a long time and lots of memory, but
+    only a few of them fit on the screen at a time anyway. This creates
+    only as many row widgets as are visible, and when the list is
+    scrolled, it reuses the same widgets for other rows.
+
+    make_row(parent) must create a widget for showing a row, and
+    update_row(widget, index) is called to make the widget show the
+    row with the given index. Don't set a button's command in
+    update_row() because tkinter creates a new Tcl command every time,
+    store the index somewhere and set the command in make_row() instead.
+    """
+
+    def __init__(self, master, count, make_row, update_row,
+                 width=200, height=300, **kwargs):
+        super().__init__(master, **kwargs)
+        self._count = count
+        self._make_row = make_row
+        self._update_row = update_row
+        self._first = 0
+        self._rows = []
+
+        # the rows don't change the size of the list
+        self._inner = ttk.Frame(self, width=width, height=height)
+        self._inner.pack_propagate(False)
+        self._scrollbar = ttk.Scrollbar(self, command=self.yview)
+        self._scrollbar.pack(side='right', fill='y')
+        self._inner.pack(side='left', fill='both', expand=True)
+
+        self._inner.bind('<Configure>', self._on_configure)
+        self._bind_mouse_wheel(self._inner)
+        self._on_configure()
+
+    def _bind_mouse_wheel(self, widget):
+        widget.bind('<MouseWheel>', self._on_mouse_wheel)   # windows, mac
+        widget.bind('<Button-4>', self._on_mouse_wheel)     # linux
+        widget.bind('<Button-5>', self._on_mouse_wheel)     # linux
+
+    def _on_mouse_wheel(self, event):
+        if getattr(event, 'num', None) == 4 or getattr(event, 'delta', 0) > 0:
+            self.yview('scroll', -3, 'units')
+        else:
+            self.yview('scroll', 3, 'units')
+
+    def _add_row(self):
+        widget = self._make_row(self._inner)
+        widget.pack(fill='x')
+        self._bind_mouse_wheel(widget)
+        self._rows.append(widget)
+
+    def _on_configure(self, event=None):
+        if not self._rows and self._count > 0:
+            # we need one row for knowing how tall the rows are
+            self._add_row()
+
+        visible = 0
+        if self._rows:
+            row_height = max(self._rows[0].winfo_reqheight(), 1)
+            visible = max(self._inner.winfo_height() // row_height, 1)
+        visible = min(visible, self._count)
+
+        while len(self._rows) < visible:
+            self._add_row()
+        while len(self._rows) > visible:
+            self._rows.pop().destroy()
+        self._refresh()
+
+    def _refresh(self):
+        self._first = max(0, min(self._first,
+                                 self._count - len(self._rows)))
+        for offset, widget in enumerate(self._rows):
+            self._update_row(widget, self._first + offset)
+
+        if self._count == 0:
+            self._scrollbar.set(0, 1)
+        else:
+            self._scrollbar.set(self._first / self._count,
+                                (self._first + len(self._rows)) / self._count)
+
+    def yview(self, *args):
+        """This is called when the scrollbar is moved."""
+        if args[0] == 'moveto':
+            self._first = round(float(args[1]) * self._count)
+        elif args[0] == 'scroll':
+            amount = int(args[1])
+            if args[2] == 'pages':
+                amount *= len(self._rows)
+            self._first += amount
+        self._refresh()
+
+    def set_count(self, count):
+        """Change the number of rows."""
+        self._count = count
+        self._on_configure()
@@ -0,0 +1,174 @@
+import concurrent.futures
+from tkinter import colorchooser, filedialog
+
+from dialogpool import DialogPool
+
+
+def _number_converter(number_type, description, minvalue, maxvalue):
+    # like what simpledialog.askinteger() and askfloat() check
+    def convert(text):
+        try:
+            value = number_type(text)
+        except ValueError:
+            raise ValueError("Not %s." % description) from None
+        if minvalue is not None and value < minvalue:
+            raise ValueError("The allowed minimum value is %s." % minvalue)
+        if maxvalue is not None and value > maxvalue:
+            raise ValueError("The allowed maximum value is %s." % maxvalue)
+        return value
+
+    return convert
+
+
+class AsyncDialogs:
+    """Show dialogs without waiting until they are closed.
+
+    The dialog functions in tkinter.messagebox and the other modules
+    return when the dialog is closed. Meanwhile they run a main loop of
+    their own, and the callback that showed the dialog is stuck in the
+    middle of what it was doing until then. These methods return right
+    away instead, and they return a concurrent.futures.Future object
+    that gets the result when the dialog is closed. There are two ways
+    to get the result:
+
+        dialogs.askyesno("Quit", "Do you want to quit?", callback=on_answer)
+
+        # with tkasyncio.run_tk()
+        answer = await asyncio.wrap_future(dialogs.askyesno(...))
+
+    The messagebox and simpledialog methods use QuestionDialogs from
+    dialogpool.py, and they don't run a main loop of their own at all.
+    The file and color dialogs are Tk's own dialogs, and they always run
+    a main loop until the dialog is closed, but it starts in an
+    after_idle callback, so the method that showed the dialog can still
+    return right away.
+
+    The callback is called only if the dialog gives a result. If a
+    dialog function raises an error, the Future gets the error, and if
+    there's a callback, tkinter shows the error like it shows errors in
+    other callbacks.
+    """
+
+    def __init__(self, widget, pool_size=2):
+        self.widget = widget
+        self.pool = DialogPool(widget, pool_size)
+
+    def _set_result(self, future, callback, result):
+        future.set_result(result)
+        # this runs in the main loop, so tkinter shows errors from the
+        # callback
+        if callback is not None:
+            callback(result)
+
+    def question(self, title, message, buttons=("Yes", "No"), callback=None):
+        """Like DialogPool.show(), but this returns a Future."""
+        future = concurrent.futures.Future()
+        self.pool.show(
+            title, message,
+            lambda text: self._set_result(future, callback, text), buttons)
+        return future
+
+    def _question(self, title, message, answers, callback):
+        # answers is {button text: result}, and the X button gives None
+        future = concurrent.futures.Future()
+        self.pool.show(
+            title, message,
+            lambda text: self._set_result(future, callback,
+                                          answers.get(text)),
+            list(answers))
+        return future
+
+    def showinfo(self, title, message, callback=None):
+        return self._question(title, message, {"OK": "ok"}, callback)
+
+    def showwarning(self, title, message, callback=None):
+        return self._question(title, message, {"OK": "ok"}, callback)
+
+    def showerror(self, title, message, callback=None):
+        return self._question(title, message, {"OK": "ok"}, callback)
+
+    def askquestion(self, title, message, callback=None):
+        return self._question(title, message, {"Yes": "yes", "No": "no"},
+                              callback)
+
+    def askyesno(self, title, message, callback=None):
+        return self._question(title, message, {"Yes": True, "No": False},
+                              callback)
+
+    def askyesnocancel(self, title, message, callback=None):
+        return self._question(
+            title, message, {"Yes": True, "No": False, "Cancel": None},
+            callback)
+
+    def askokcancel(self, title, message, callback=None):
+        return self._question(title, message, {"OK": True, "Cancel": False},
+                              callback)
+
+    def askretrycancel(self, title, message, callback=None):
+        return self._question(
+            title, message, {"Retry": True, "Cancel": False}, callback)
+
+    def _ask_entry(self, title, prompt, initialvalue, convert, callback):
+        future = concurrent.futures.Future()
+        text = '' if initialvalue is None else str(initialvalue)
+        self.pool.show_entry(
+            title, prompt,
+            lambda result: self._set_result(future, callback, result),
+            text, convert)
+        return future
+
+    def askstring(self, title, prompt, callback=None, initialvalue=None):
+        return self._ask_entry(title, prompt, initialvalue, str, callback)
+
+    def askinteger(self, title, prompt, callback=None, initialvalue=None,
+                   minvalue=None, maxvalue=None):
+        convert = _number_converter(int, "an integer", minvalue, maxvalue)
+        return self._ask_entry(title, prompt, initialvalue, convert,
+                               callback)
+
+    def askfloat(self, title, prompt, callback=None, initialvalue=None,
+                 minvalue=None, maxvalue=None):
+        convert = _number_converter(float, "a floating point value",
+                                    minvalue, maxvalue)
+        return self._ask_entry(title, prompt, initialvalue, convert,
+                               callback)
+
+    def call(self, function, *args, callback=None, **kwargs):
+        """Call a tkinter dialog function in an after_idle callback.
+
+        The Future gets whatever the function returns, or the error if
+        the function raises one.
+        """
+        future = concurrent.futures.Future()
+
+        def run_function():
+            try:
+                result = function(*args, **kwargs)
+            except Exception as e:
+                future.set_exception(e)
+                if callback is not None:
+                    raise
+                return
+            self._set_result(future, callback, result)
+
+        self.widget.after_idle(run_function)
+        return future
+
+    def askopenfilename(self, callback=None, **kwargs):
+        return self.call(filedialog.askopenfilename, callback=callback,
+                         **kwargs)
+
+    def askopenfilenames(self, callback=None, **kwargs):
+        return self.call(filedialog.askopenfilenames, callback=callback,
+                         **kwargs)
+
+    def asksaveasfilename(self, callback=None, **kwargs):
+        return self.call(filedialog.asksaveasfilename, callback=callback,
+                         **kwargs)
+
+    def askdirectory(self, callback=None, **kwargs):
+        return self.call(filedialog.askdirectory, callback=callback,
+                         **kwargs)
+
+    def askcolor(self, callback=None, **kwargs):
+        return self.call(colorchooser.askcolor, callback=callback, **kwargs)
@@ -0,0 +1,30 @@
+import tkinter
+from tkinter import ttk
+
+from dialogpool import DialogPool
+
+
+def delete_thing():
+    answer = dialogs.ask("Delete", "Do you really want to delete the thing?")
+    if answer == "Yes":
+        print("deleting the thing")
+
+
+def save_thing():
+    answer = dialogs.ask("Save", "Where do you want to save the thing?",
+                         ["Here", "There", "Nowhere"])
+    print("saving the thing to", answer)
+
+
+root = tkinter.Tk()
+big_frame = ttk.Frame(root)
+big_frame.pack(fill='both', expand=True)
+
+# the dialogs are created when the main loop starts
+dialogs = DialogPool(root)
+
+delete_button = ttk.Button(big_frame, text="Delete", command=delete_thing)
+delete_button.pack()
+save_button = ttk.Button(big_frame, text="Save", command=save_thing)
+save_button.pack()
+root.mainloop()
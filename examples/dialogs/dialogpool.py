@@ -0,0 +1,216 @@
+import functools
+import tkinter
+from tkinter import ttk
+
+
+class QuestionDialog:
+    """A dialog with a message and buttons that can be shown many times.
+
+    The dialog is hidden with withdraw() instead of destroying it, so
+    showing it again doesn't need to create any widgets, unless it needs
+    more buttons than it had before. It can also have an entry for
+    asking things like simpledialog.askstring() does, see show_entry().
+    """
+
+    def __init__(self, parent):
+        self.window = tkinter.Toplevel(parent)
+        self.window.withdraw()
+        self.window.transient(parent)
+        self.window.protocol('WM_DELETE_WINDOW', self._on_close)
+
+        big_frame = ttk.Frame(self.window)
+        big_frame.pack(fill='both', expand=True)
+        self._label = ttk.Label(big_frame, wraplength=300)
+        self._label.pack(fill='both', expand=True, padx=10, pady=10)
+        self._entry = ttk.Entry(big_frame)     # packed only when needed
+        self._entry.bind('<Return>', self._on_return)
+        self._button_frame = ttk.Frame(big_frame)
+        self._button_frame.pack()
+
+        self._buttons = []
+        self._button_texts = []
+        self._message = ''
+        self._callback = None
+        self._convert = None    # not None when the entry is showing
+
+    def _on_button(self, index):
+        if self._convert is None:
+            self._finish(self._button_texts[index])
+        elif index == 0:
+            self._on_return()
+        else:
+            self._finish(None)      # the cancel button
+
+    def _on_return(self, event=None):
+        if self._convert is None:
+            return
+        try:
+            result = self._convert(self._entry.get())
+        except ValueError as e:
+            # let the user try again
+            self._label['text'] = '%s\n\n%s' % (self._message, e)
+            self._entry.focus()
+            return
+        self._finish(result)
+
+    def _on_close(self):
+        self._finish(None)
+
+    def _finish(self, result):
+        self.window.grab_release()
+        self.window.withdraw()
+        callback = self._callback
+        self._callback = None
+        self._convert = None
+        callback(result)
+
+    def _set_buttons(self, texts):
+        self._button_texts = list(texts)
+        while len(self._buttons) < len(texts):
+            # the command is set only here because setting it creates a
+            # new Tcl command every time
+            index = len(self._buttons)
+            button = ttk.Button(self._button_frame, command=functools.partial(
+                self._on_button, index))
+            self._buttons.append(button)
+
+        for index, button in enumerate(self._buttons):
+            if index < len(texts):
+                button['text'] = texts[index]
+                button.pack(side='left', padx=5, pady=5)
+            else:
+                button.pack_forget()
+
+    def _show(self, title, message, buttons, callback):
+        self.window.title(title)
+        self._label['text'] = self._message = message
+        self._set_buttons(buttons)
+        self._callback = callback
+
+        self.window.deiconify()
+        self.window.grab_set()      # the user can't click other windows
+
+    def show(self, title, message, buttons, callback):
+        """Show the dialog and return right away.
+
+        When the user clicks a button, the dialog is hidden and
+        callback(text_of_the_button) is called, or callback(None) if the
+        dialog was closed with the X button.
+        """
+        if not buttons:
+            raise ValueError("the dialog needs at least one button")
+        self._entry.pack_forget()
+        self._show(title, message, buttons, callback)
+        self._buttons[0].focus()
+
+    def show_entry(self, title, message, callback, text='', convert=str):
+        """Like show(), but with an entry and OK and Cancel buttons.
+
+        When the user clicks OK or presses Enter, the dialog is hidden
+        and callback(convert(text_of_the_entry)) is called. If convert()
+        raises ValueError, the error message is shown in the dialog, and
+        the user can try again. Cancel and the X button call
+        callback(None).
+        """
+        self._entry.delete(0, 'end')
+        self._entry.insert(0, text)
+        self._entry.pack(before=self._button_frame, fill='x', padx=10)
+        self._show(title, message, ["OK", "Cancel"], callback)
+        self._convert = convert
+        self._entry.select_range(0, 'end')
+        self._entry.focus()
+
+    def ask(self, title, message, buttons):
+        """Show the dialog and wait until the user clicks a button.
+
+        This returns what show() would give to the callback.
+        """
+        result = [None]
+        done = tkinter.BooleanVar(self.window)
+
+        def callback(value):
+            result[0] = value
+            done.set(True)
+
+        self.show(title, message, buttons, callback)
+        self.window.wait_variable(done)
+        return result[0]
+
+
+def _exists(dialog):
+    # dialogs are destroyed when their parent is destroyed, e.g. when the
+    # user closes the main window while a dialog is showing
+    try:
+        return bool(dialog.window.winfo_exists())
+    except tkinter.TclError:
+        # the whole tkinter application has been destroyed
+        return False
+
+
+class DialogPool:
+    """Keep some hidden dialogs around so they can be shown quickly.
+
+    Creating a Toplevel with its widgets and computing the layout takes
+    some time, and programs that ask the same question over and over
+    again shouldn't do that every time. The dialogs are created when the
+    main loop has nothing else to do, so they don't slow down starting
+    the program. If all dialogs are showing already, e.g. when a dialog
+    is opened while another dialog is waiting, a new dialog is created.
+    """
+
+    def __init__(self, parent, size=2):
+        self.parent = parent
+        self.size = size
+        self._free = []
+        parent.after_idle(self._fill)
+
+    def _fill(self):
+        while len(self._free) < self.size:
+            self._free.append(QuestionDialog(self.parent))
+
+    def _get_dialog(self):
+        while self._free:
+            dialog = self._free.pop()
+            if _exists(dialog):
+                return dialog
+        return QuestionDialog(self.parent)
+
+    def _put_back(self, dialog):
+        if not _exists(dialog):
+            return
+        if len(self._free) < self.size:
+            self._free.append(dialog)
+        else:
+            dialog.window.destroy()
+
+    def ask(self, title, message, buttons=("Yes", "No")):
+        """Like QuestionDialog.ask(), but with a dialog from the pool."""
+        dialog = self._get_dialog()
+        try:
+            return dialog.ask(title, message, buttons)
+        finally:
+            self._put_back(dialog)
+
+    def _borrow(self, callback):
+        # returns a dialog and a callback that puts the dialog back
+        dialog = self._get_dialog()
+
+        def on_answer(result):
+            self._put_back(dialog)
+            callback(result)
+
+        return (dialog, on_answer)
+
+    def show(self, title, message, callback, buttons=("Yes", "No")):
+        """Like QuestionDialog.show(), but with a dialog from the pool."""
+        dialog, on_answer = self._borrow(callback)
+        try:
+            dialog.show(title, message, buttons, on_answer)
+        except ValueError:
+            self._put_back(dialog)
+            raise
+
+    def show_entry(self, title, message, callback, text='', convert=str):
+        """Like QuestionDialog.show_entry(), with a dialog from the pool."""
+        dialog, on_answer = self._borrow(callback)
+        dialog.show_entry(title, message, on_answer, text, convert)
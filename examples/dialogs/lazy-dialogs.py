@@ -0,0 +1,20 @@
+import tkinter
+from tkinter import ttk
+
+# the dialog modules are imported when a dialog is shown for the first time
+from lazydialogs import messagebox, filedialog
+
+
+def open_file():
+    filename = filedialog.askopenfilename()
+    if filename:    # the user didn't click cancel
+        messagebox.showinfo("File Chosen", "You chose %s." % filename)
+
+
+root = tkinter.Tk()
+big_frame = ttk.Frame(root)
+big_frame.pack(fill='both', expand=True)
+
+button = ttk.Button(big_frame, text="Open a file", command=open_file)
+button.pack()
+root.mainloop()
@@ -0,0 +1,34 @@
+import importlib
+
+
+class LazyModule:
+    """A module that is imported when it's used for the first time.
+
+    Use this like the module itself:
+
+        messagebox = LazyModule('tkinter.messagebox')
+        ...
+        messagebox.showinfo("Hello", "Hello World!")    # imports here
+
+    Tk loads the Tcl code of its dialogs when they are shown for the
+    first time, so only the Python modules need this.
+    """
+
+    def __init__(self, name):
+        self.__name__ = name
+        self._module = None
+
+    # this is called only for attributes that LazyModule doesn't have
+    def __getattr__(self, attribute):
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+        return getattr(self._module, attribute)
+
+    def __repr__(self):
+        return '<lazy module %r>' % self.__name__
+
+
+messagebox = LazyModule('tkinter.messagebox')
+filedialog = LazyModule('tkinter.filedialog')
+simpledialog = LazyModule('tkinter.simpledialog')
+colorchooser = LazyModule('tkinter.colorchooser')
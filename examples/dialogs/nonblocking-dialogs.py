@@ -0,0 +1,50 @@
+import time
+import tkinter
+from tkinter import ttk
+
+from asyncdialogs import AsyncDialogs
+
+
+def update_clock():
+    # this keeps running while the dialogs are showing
+    clock_label['text'] = time.strftime('%H:%M:%S')
+    root.after(100, update_clock)
+
+
+def on_quit_answer(answer):
+    if answer:
+        root.destroy()
+
+
+def on_name_answer(name):
+    if name is not None:
+        name_label['text'] = "Hello %s!" % name
+
+
+def ask_quit():
+    # these return right away, and the callbacks run later
+    dialogs.askyesno("Quit", "Do you really want to quit?",
+                     callback=on_quit_answer)
+
+
+def ask_name():
+    dialogs.askstring("Name", "What is your name?", callback=on_name_answer)
+
+
+root = tkinter.Tk()
+big_frame = ttk.Frame(root)
+big_frame.pack(fill='both', expand=True)
+
+dialogs = AsyncDialogs(root)
+
+clock_label = ttk.Label(big_frame)
+clock_label.pack()
+name_label = ttk.Label(big_frame, text="Hello!")
+name_label.pack()
+name_button = ttk.Button(big_frame, text="Change name", command=ask_name)
+name_button.pack()
+quit_button = ttk.Button(big_frame, text="Quit", command=ask_quit)
+quit_button.pack()
+
+update_clock()
+root.mainloop()
@@ -0,0 +1,49 @@
+import asyncio
+import time
+import tkinter
+from tkinter import ttk
+
+import tkasyncio
+
+
+# this is like change_text in timeout-clock.py, but it doesn't need
+# after callbacks
+async def change_text():
+    while True:
+        label['text'] = time.asctime()
+        await asyncio.sleep(1)
+
+
+async def do_slow_stuff():
+    button['state'] = 'disabled'
+    for i in range(1, 5):
+        status_label['text'] = "%d ..." % i
+        # this could be e.g. downloading something with asyncio
+        await asyncio.sleep(1)
+    status_label['text'] = "done!"
+    button['state'] = 'normal'
+
+
+def start_doing_slow_stuff():
+    # this doesn't wait for do_slow_stuff() to finish
+    asyncio.ensure_future(do_slow_stuff())
+
+
+async def main():
+    asyncio.ensure_future(change_text())
+    await tkasyncio.run_tk(root)
+
+
+root = tkinter.Tk()
+big_frame = ttk.Frame(root)
+big_frame.pack(fill='both', expand=True)
+
+label = ttk.Label(big_frame, text='0')
+label.pack()
+button = ttk.Button(big_frame, text="Start", command=start_doing_slow_stuff)
+button.pack()
+status_label = ttk.Label(big_frame)
+status_label.pack()
+
+root.geometry('200x200')
+asyncio.run(main())
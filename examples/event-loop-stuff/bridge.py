@@ -0,0 +1,42 @@
+import threading
+import time
+import tkinter
+from tkinter import ttk
+
+from tkbridge import Bridge
+
+
+def thread_target():
+    for number in range(10):
+        print("thread_target tells tkinter to show hello", number)
+        bridge.call(show_message, "hello {}".format(number))
+        time.sleep(1)
+
+    print("thread_target is done")
+    bridge.call(show_message, "done")
+
+
+# bridge.call() runs this in tkinter's main loop, so this can do
+# tkinter stuff
+def show_message(message):
+    print("show_message got", message)
+    label['text'] = message
+
+
+root = tkinter.Tk()
+big_frame = ttk.Frame(root)
+big_frame.pack(fill='both', expand=True)
+
+label = ttk.Label(big_frame)
+label.pack()
+
+bridge = Bridge(root)
+thread = threading.Thread(target=thread_target)
+thread.start()
+
+root.geometry('200x200')
+root.mainloop()
+
+# the thread must not call bridge.call() after this
+thread.join()
+bridge.close()
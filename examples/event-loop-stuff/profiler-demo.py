@@ -0,0 +1,38 @@
+import time
+import tkinter
+from tkinter import ttk
+
+import tkprofiler
+
+# this must be called before creating any widgets or callbacks, and the
+# report is printed when the program exits
+tkprofiler.install(threshold=16)
+
+
+def fast_callback():
+    print("hello")
+
+
+# this freezes the GUI for half a second, like the blocking callback
+# in the button chapter
+def slow_callback():
+    time.sleep(0.5)
+
+
+def change_text():
+    label['text'] = time.asctime()
+    root.after(1000, change_text)
+
+
+root = tkinter.Tk()
+big_frame = ttk.Frame(root)
+big_frame.pack(fill='both', expand=True)
+
+label = ttk.Label(big_frame)
+label.pack()
+ttk.Button(big_frame, text="Fast", command=fast_callback).pack()
+ttk.Button(big_frame, text="Slow", command=slow_callback).pack()
+
+change_text()
+root.geometry('200x200')
+root.mainloop()
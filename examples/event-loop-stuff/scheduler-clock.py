@@ -0,0 +1,42 @@
+import time
+import tkinter
+from tkinter import ttk
+
+from tkscheduler import Scheduler
+
+
+def update_clock():
+    clock_label['text'] = time.strftime('%H:%M:%S')
+
+
+def update_counter():
+    counter_label['text'] = int(counter_label['text']) + 1
+
+
+def update_uptime():
+    uptime_label['text'] = "Running for %.1f seconds" % (
+        time.monotonic() - start_time)
+
+
+root = tkinter.Tk()
+big_frame = ttk.Frame(root)
+big_frame.pack(fill='both', expand=True)
+
+clock_label = ttk.Label(big_frame)
+clock_label.pack()
+counter_label = ttk.Label(big_frame, text='0')
+counter_label.pack()
+uptime_label = ttk.Label(big_frame)
+uptime_label.pack()
+
+start_time = time.monotonic()
+scheduler = Scheduler(root)
+scheduler.add(1000, update_clock)
+scheduler.add(100, update_counter)
+scheduler.add(500, update_uptime)
+
+root.geometry('200x200')
+root.mainloop()
+
+# let's see how well it went
+print(scheduler.report())
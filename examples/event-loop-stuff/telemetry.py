@@ -0,0 +1,55 @@
+import queue
+import random
+import threading
+import time
+import tkinter
+from tkinter import ttk
+
+from tkupdater import Updater
+
+NUMBER_OF_SENSORS = 100
+the_queue = queue.Queue()
+
+
+def thread_target():
+    # pretend that this reads lots of sensors really fast
+    while True:
+        sensor = random.randrange(NUMBER_OF_SENSORS)
+        the_queue.put((sensor, random.randint(0, 9)))
+        time.sleep(0.0001)
+
+
+def after_callback():
+    while True:
+        try:
+            sensor, value = the_queue.get(block=False)
+        except queue.Empty:
+            break
+        # this doesn't change the label yet, so it's fast
+        updater.set(labels[sensor], "Sensor %d: %d" % (sensor, value))
+
+    root.after(20, after_callback)     # 50 times per second
+
+
+def show_report():
+    status_label['text'] = updater.report()
+    root.after(1000, show_report)
+
+
+root = tkinter.Tk()
+big_frame = ttk.Frame(root)
+big_frame.pack(fill='both', expand=True)
+
+updater = Updater(root)
+labels = []
+for sensor in range(NUMBER_OF_SENSORS):
+    label = ttk.Label(big_frame, width=15)
+    label.grid(row=sensor // 5, column=sensor % 5)
+    labels.append(label)
+status_label = ttk.Label(big_frame)
+status_label.grid(row=NUMBER_OF_SENSORS // 5, column=0, columnspan=5)
+
+threading.Thread(target=thread_target, daemon=True).start()
+after_callback()
+show_report()
+root.mainloop()
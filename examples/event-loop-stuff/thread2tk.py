@@ -18,20 +18,37 @@ def thread_target():
     the_queue.put(None)
 
 
-def after_callback():
-    try:
-        message = the_queue.get(block=False)
-    except queue.Empty:
-        # let's try again later
-        root.after(100, after_callback)
+def after_callback(interval):
+    # get everything that is in the queue, but stop after 50 milliseconds
+    # so that the GUI doesn't freeze if the thread puts stuff there
+    # really fast
+    messages = []
+    stop_time = time.monotonic() + 0.05
+    while time.monotonic() < stop_time:
+        try:
+            messages.append(the_queue.get(block=False))
+        except queue.Empty:
+            break
+
+    if messages:
+        print('after_callback got', messages)
+    texts = [message for message in messages if message is not None]
+    if texts:
+        # the label can show only one text at a time, so there's no need
+        # to show the other texts
+        label['text'] = texts[-1]
+
+    if None in messages:
+        # the thread is done, no need to come back later
         return
 
-    print('after_callback got', message)
-    if message is not None:
-        # we're not done yet, let's do something with the message and
-        # come back later
-        label['text'] = message
-        root.after(100, after_callback)
+    if messages:
+        # more messages are probably coming soon
+        interval = 20
+    else:
+        # nothing is happening, we don't need to check that often
+        interval = min(interval * 2, 200)
+    root.after(interval, after_callback, interval)
 
 
 root = tkinter.Tk()
@@ -42,7 +59,7 @@ label = ttk.Label(big_frame)
 label.pack()
 
 threading.Thread(target=thread_target).start()
-root.after(100, after_callback)
+root.after(100, after_callback, 100)
 
 root.geometry('200x200')
 root.mainloop()
@@ -0,0 +1,81 @@
+import itertools
+import queue
+import threading
+import time
+import tkinter
+from tkinter import ttk
+
+NUMBER_OF_THREADS = 4
+
+# if there are already 10 jobs waiting, we don't take more jobs
+job_queue = queue.Queue(maxsize=10)
+result_queue = queue.Queue()
+job_numbers = itertools.count(1)
+
+
+def thread_target():
+    while True:
+        job_number = job_queue.get()
+        if job_number is None:
+            print("thread_target: got None, exiting...")
+            return
+
+        print("thread_target: doing job", job_number, "...")
+        time.sleep(1)
+        result_queue.put("job {} is done".format(job_number))
+
+
+def on_click():
+    job_number = next(job_numbers)
+    try:
+        job_queue.put(job_number, block=False)
+    except queue.Full:
+        status_label['text'] = "Too busy, job {} was dropped".format(
+            job_number)
+    else:
+        status_label['text'] = "Added job {}".format(job_number)
+
+
+def check_results():
+    # this is like after_callback in thread2tk.py
+    results = []
+    while True:
+        try:
+            results.append(result_queue.get(block=False))
+        except queue.Empty:
+            break
+
+    if results:
+        result_label['text'] = results[-1]
+    root.after(100, check_results)
+
+
+root = tkinter.Tk()
+big_frame = ttk.Frame(root)
+big_frame.pack(fill='both', expand=True)
+
+ttk.Button(big_frame, text="Click me", command=on_click).pack()
+status_label = ttk.Label(big_frame)
+status_label.pack()
+result_label = ttk.Label(big_frame)
+result_label.pack()
+
+threads = []
+for i in range(NUMBER_OF_THREADS):
+    thread = threading.Thread(target=thread_target)
+    thread.start()
+    threads.append(thread)
+
+root.after(100, check_results)
+root.geometry('250x100')
+root.mainloop()
+
+# the user closed the window, so we can forget the jobs that haven't
+# started yet, and then we tell each thread to stop
+while True:
+    try:
+        job_queue.get(block=False)
+    except queue.Empty:
+        break
+for thread in threads:
+    job_queue.put(None)
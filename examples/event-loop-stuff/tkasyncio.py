@@ -0,0 +1,47 @@
+import asyncio
+import tkinter
+
+import _tkinter
+
+
+async def run_tk(root, interval=0.02, max_events=100):
+    """Run tkinter's main loop in asyncio until root is destroyed.
+
+    Use this instead of root.mainloop(), like this:
+
+        asyncio.run(tkasyncio.run_tk(root))
+
+    Then tkinter callbacks can start coroutines with
+    asyncio.ensure_future(), and the coroutines can do tkinter stuff
+    because everything runs in the same thread.
+
+    When tkinter has nothing to do, this checks for new tkinter events
+    every interval seconds, so the program wakes up 50 times a second
+    by default even if nothing happens. At most max_events tkinter
+    events are handled before letting asyncio run, so coroutines keep
+    running even if tkinter always has something to do, e.g. because
+    an after_idle callback keeps rescheduling itself.
+    """
+    def root_exists():
+        try:
+            return root.winfo_exists()
+        except tkinter.TclError:
+            # root has been destroyed
+            return False
+
+    while root_exists():
+        # do everything that tkinter has to do right now, but don't wait
+        # for more things to happen
+        did_something = False
+        for event_number in range(max_events):
+            if not (root_exists() and root.tk.dooneevent(_tkinter.DONT_WAIT)):
+                break
+            did_something = True
+
+        # if tkinter did something, the user is probably doing something
+        # and we come back as soon as possible, otherwise we let asyncio
+        # run or sleep for a while
+        if did_something:
+            await asyncio.sleep(0)
+        else:
+            await asyncio.sleep(interval)
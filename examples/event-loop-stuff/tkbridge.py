@@ -0,0 +1,98 @@
+import os
+import queue
+import threading
+import tkinter
+
+
+class Bridge:
+    """Run functions in tkinter's main loop from other threads.
+
+    Unlike checking a queue with after callbacks, this wakes up the main
+    loop right away when there's something to do, and doesn't do
+    anything at all when there's nothing to do. Create the bridge in
+    the main thread, and then call its call() method in threads.
+    """
+
+    def __init__(self, widget):
+        self._widget = widget
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._wakeup_pending = False
+
+        self._use_pipe = hasattr(widget.tk, 'createfilehandler')
+        if self._use_pipe:
+            # writing a byte to a pipe wakes up tkinter's main loop, and
+            # unlike tkinter stuff, os.write() is safe to do in threads
+            self._read_fd, self._write_fd = os.pipe()
+            widget.tk.createfilehandler(
+                self._read_fd, tkinter.READABLE, self._on_pipe_readable)
+        else:
+            # windows doesn't have createfilehandler, but event_generate
+            # works in threads with when='tail'
+            self._event_name = '<<BridgeWakeup%d>>' % id(self)
+            widget.bind(self._event_name, self._run_pending)
+
+    def call(self, function, *args):
+        """Run function(*args) in the main loop soon.
+
+        This can be called in any thread. If the main loop isn't
+        running, e.g. because the window was closed, the function isn't
+        called, at least not before the main loop runs again.
+        """
+        self._queue.put((function, args))
+        self._wake_up()
+
+    def _wake_up(self):
+        with self._lock:
+            # if the main loop hasn't woken up from the previous call
+            # yet, it will run this function too when it does
+            if self._wakeup_pending:
+                return
+            self._wakeup_pending = True
+
+        if self._use_pipe:
+            os.write(self._write_fd, b'x')
+            return
+
+        try:
+            self._widget.event_generate(self._event_name, when='tail')
+        except (RuntimeError, tkinter.TclError):
+            # tkinter raises RuntimeError if this is called in a thread
+            # while the main loop isn't running, and TclError if the
+            # widget has been destroyed, and then the next call() must
+            # try to wake up the main loop again
+            with self._lock:
+                self._wakeup_pending = False
+
+    def _on_pipe_readable(self, fd, mask):
+        os.read(self._read_fd, 1)
+        self._run_pending()
+
+    def _run_pending(self, event=None):
+        with self._lock:
+            self._wakeup_pending = False
+
+        while True:
+            try:
+                function, args = self._queue.get(block=False)
+            except queue.Empty:
+                break
+            try:
+                function(*args)
+            except BaseException:
+                # tkinter shows the error, and then the main loop must
+                # wake up again to run the rest of the functions
+                self._wake_up()
+                raise
+
+    def close(self):
+        """Stop using the bridge.
+
+        Call this in the main thread after the threads are done.
+        """
+        if self._use_pipe:
+            self._widget.tk.deletefilehandler(self._read_fd)
+            os.close(self._read_fd)
+            os.close(self._write_fd)
+        else:
+            self._widget.unbind(self._event_name)
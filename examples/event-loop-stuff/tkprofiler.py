@@ -0,0 +1,157 @@
+import atexit
+import collections
+import functools
+import sys
+import threading
+import time
+import traceback
+import tkinter
+
+
+# the histograms count how many calls took less than 1ms, 1-4ms, etc.
+BUCKETS = [1, 4, 16, 64, 256, 1024]
+
+
+def get_name(function):
+    while True:
+        if isinstance(function, functools.partial):
+            function = function.func
+        elif getattr(function, '__qualname__', '').endswith(
+                'after.<locals>.callit'):
+            # after() and after_idle() give tkinter a callit function
+            # that calls the function, and we want the function
+            closure = dict(zip(function.__code__.co_freevars,
+                               function.__closure__))
+            function = closure['func'].cell_contents
+        else:
+            break
+    module = getattr(function, '__module__', None) or '?'
+    name = getattr(function, '__qualname__', None) or repr(function)
+    return module + '.' + name
+
+
+class Profiler:
+    """Measure how long tkinter callbacks block the main loop.
+
+    All command callbacks, after callbacks and bindings go through
+    tkinter.CallWrapper, so this replaces CallWrapper.__call__ with a
+    function that times the callback. A thread watches the main thread,
+    and if a callback takes longer than threshold milliseconds, it
+    saves a traceback of what the main thread is doing. That tells
+    where the slow callback spends its time.
+
+    Callbacks that open dialogs look slow because the dialog runs its
+    own main loop until it's closed. Tkinter creates a CallWrapper when
+    a callback is given to Tk, and it keeps using the original __call__
+    method, so only callbacks created after install() are measured.
+    """
+
+    def __init__(self, threshold=16, max_stalls=10):
+        self.threshold = threshold / 1000
+        self.max_stalls = max_stalls
+        self.calls = collections.Counter()
+        self.total_times = collections.Counter()
+        self.max_times = collections.Counter()
+        self.histograms = collections.defaultdict(
+            lambda: [0] * (len(BUCKETS) + 1))
+        self.stalls = []        # [(seconds, name, stack), ...]
+
+        self._running = []      # [(name, start_time, stack_list), ...]
+        self._lock = threading.Lock()
+        self._main_thread_id = threading.get_ident()
+        self._original_call = None
+        self._stop = threading.Event()
+
+    def install(self):
+        if self._original_call is not None:
+            raise RuntimeError("the profiler is already installed")
+        original_call = self._original_call = tkinter.CallWrapper.__call__
+        profiler = self
+
+        def __call__(wrapper, *args):
+            return profiler._call(wrapper, original_call, args)
+
+        tkinter.CallWrapper.__call__ = __call__
+        threading.Thread(target=self._watch, daemon=True).start()
+
+    def uninstall(self):
+        tkinter.CallWrapper.__call__ = self._original_call
+        self._original_call = None
+        self._stop.set()
+
+    def _call(self, wrapper, original_call, args):
+        name = get_name(wrapper.func)
+        stack = []      # the watcher thread puts a traceback here
+        start = time.perf_counter()
+        with self._lock:
+            self._running.append((name, start, stack))
+        try:
+            return original_call(wrapper, *args)
+        finally:
+            seconds = time.perf_counter() - start
+            with self._lock:
+                self._running.pop()
+            self._add(name, seconds, stack)
+
+    def _add(self, name, seconds, stack):
+        self.calls[name] += 1
+        self.total_times[name] += seconds
+        self.max_times[name] = max(self.max_times[name], seconds)
+        milliseconds = seconds * 1000
+        bucket = 0
+        while bucket < len(BUCKETS) and milliseconds >= BUCKETS[bucket]:
+            bucket += 1
+        self.histograms[name][bucket] += 1
+
+        if seconds >= self.threshold:
+            print("tkprofiler: %s blocked the main loop for %.1fms" % (
+                name, milliseconds), file=sys.stderr)
+            self.stalls.append((seconds, name, ''.join(stack)))
+            self.stalls.sort(reverse=True)
+            del self.stalls[self.max_stalls:]
+
+    def _watch(self):
+        while not self._stop.wait(self.threshold / 2):
+            with self._lock:
+                now = time.perf_counter()
+                # callbacks can run inside other callbacks, e.g. when a
+                # callback opens a dialog, and then they're all slow
+                slow_stacks = [stack for name, start, stack in self._running
+                               if not stack and now - start >= self.threshold]
+                if not slow_stacks:
+                    continue
+                frame = sys._current_frames().get(self._main_thread_id)
+                if frame is not None:
+                    for stack in slow_stacks:
+                        stack.extend(traceback.format_stack(frame))
+
+    def report(self, file=sys.stderr):
+        """Print the callbacks that took the most time in total."""
+        labels = ['<%dms' % limit for limit in BUCKETS]
+        labels.append('>=%dms' % BUCKETS[-1])
+        print(('%-40s %6s %9s %8s' + ' %7s' * len(labels)) % tuple(
+            ['callback', 'calls', 'total ms', 'max ms'] + labels), file=file)
+        for name, total in self.total_times.most_common():
+            print(('%-40s %6d %9.1f %8.1f' + ' %7d' * len(labels)) % tuple(
+                [name[-40:], self.calls[name], total * 1000,
+                 self.max_times[name] * 1000] + self.histograms[name]),
+                file=file)
+
+        for seconds, name, stack in self.stalls:
+            print(file=file)
+            print("%s took %.1fms" % (name, seconds * 1000), file=file)
+            if stack:
+                print("The main thread was doing this:", file=file)
+                print(stack, end='', file=file)
+
+
+def install(threshold=16, report_on_exit=True):
+    """Start profiling all tkinter callbacks, return a Profiler.
+
+    Call this before creating any widgets or callbacks.
+    """
+    profiler = Profiler(threshold)
+    profiler.install()
+    if report_on_exit:
+        atexit.register(profiler.report)
+    return profiler
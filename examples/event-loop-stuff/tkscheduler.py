@@ -0,0 +1,117 @@
+import functools
+import math
+import time
+
+
+class Task:
+    """Something that the scheduler runs repeatedly.
+
+    The attributes tell how it has been going: runs is the number of
+    times the function was called, skipped is the number of times it
+    wasn't called because it was late, and the times are in seconds.
+    """
+
+    def __init__(self, scheduler, period, function, args):
+        self.scheduler = scheduler
+        self.period = period
+        self.function = function
+        self.args = args
+        self.runs = 0
+        self.skipped = 0
+        self.total_time = 0
+        self.max_time = 0
+        self.max_lateness = 0
+
+        # the first run is aligned to the clock, e.g. a task that runs
+        # once a second runs when time.time() is a whole number
+        self.deadline = math.ceil(time.time() / period) * period
+
+    def cancel(self):
+        self.scheduler.tasks.remove(self)
+        self.scheduler._reschedule()
+
+    def __repr__(self):
+        function = self.function
+        while isinstance(function, functools.partial):
+            function = function.func
+        # callable objects don't necessarily have a __name__
+        name = getattr(function, '__name__', repr(function))
+
+        average = self.total_time / self.runs if self.runs else 0
+        return ('<Task %s: every %gs, %d runs, %d skipped, '
+                'average %.1fms, max %.1fms, max late %.1fms>' % (
+                    name, self.period, self.runs,
+                    self.skipped, average * 1000, self.max_time * 1000,
+                    self.max_lateness * 1000))
+
+
+class Scheduler:
+    """Run functions repeatedly with after callbacks.
+
+    Chaining root.after() calls like in timeout-clock.py is fine for one
+    thing, but the time that the function takes is added to every
+    period, so the clock slowly drifts, and every repeating thing needs
+    its own after callback. The scheduler keeps track of when each task
+    should run next, and uses only one after callback for all of them.
+    If a task is late by more than one period, the missed runs are
+    skipped instead of running the task many times in a row.
+    """
+
+    # tasks that should run within this many seconds are ran together
+    slack = 0.002
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.tasks = []
+        self._after_id = None
+
+    def add(self, milliseconds, function, *args):
+        """Run function(*args) every milliseconds, return a Task."""
+        task = Task(self, milliseconds / 1000, function, args)
+        self.tasks.append(task)
+        self._reschedule()
+        return task
+
+    def _reschedule(self):
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        if self.tasks:
+            next_deadline = min(task.deadline for task in self.tasks)
+            delay = math.ceil((next_deadline - time.time()) * 1000)
+            self._after_id = self.widget.after(max(delay, 0), self._tick)
+
+    def _tick(self):
+        self._after_id = None
+        try:
+            for task in list(self.tasks):
+                now = time.time()
+                if task not in self.tasks or task.deadline > now + self.slack:
+                    # cancelled or not yet
+                    continue
+                self._run_task(task, now)
+        finally:
+            # if a task raised an error, tkinter shows it, and the other
+            # tasks keep running, starting from the next tick
+            self._reschedule()
+
+    def _run_task(self, task, now):
+        task.max_lateness = max(task.max_lateness, now - task.deadline)
+        try:
+            task.function(*task.args)
+        finally:
+            end = time.time()
+            task.runs += 1
+            task.total_time += end - now
+            task.max_time = max(task.max_time, end - now)
+
+            # the next deadline depends on the previous deadline, not on
+            # the current time, so the task doesn't drift
+            periods = max(1, math.floor((end - task.deadline) / task.period)
+                          + 1)
+            task.skipped += periods - 1
+            task.deadline += periods * task.period
+
+    def report(self):
+        """Return a string that describes how the tasks are doing."""
+        return '\n'.join(map(repr, self.tasks))
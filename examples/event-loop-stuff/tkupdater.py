@@ -0,0 +1,75 @@
+import tkinter
+
+
+class Updater:
+    """Change widget options at most once per main loop iteration.
+
+    Every label['text'] = something runs a Tcl command, and if the same
+    label changes many times before Tk draws it again, only the last
+    change is ever seen. The set() method of the updater only remembers
+    the new value, and an after_idle callback does the changes when the
+    main loop has handled everything else. Changes that would set an
+    option to the value that it already has are also skipped, so don't
+    change the same options without the updater.
+
+    The attributes tell how it has been going: requests is the number
+    of set() calls, configures is the number of changes actually done,
+    and skipped is the difference.
+    """
+
+    def __init__(self, widget):
+        self.widget = widget
+        self.requests = 0
+        self.configures = 0
+        self._pending = {}      # {key: (target, option, value)}
+        self._current = {}      # {key: value}
+        self._after_id = None
+
+    @property
+    def skipped(self):
+        return self.requests - self.configures
+
+    def set(self, target, value, option='text'):
+        """Set an option of a widget, or the value of a StringVar.
+
+        The option is ignored for variables, and it's 'text' by default
+        for widgets.
+        """
+        if isinstance(target, tkinter.Variable):
+            option = None
+        self.requests += 1
+        self._pending[(str(target), option)] = (target, option, value)
+        if self._after_id is None:
+            self._after_id = self.widget.after_idle(self._on_idle)
+
+    def _on_idle(self):
+        self._after_id = None
+        self.flush()
+
+    def flush(self):
+        """Do the pending changes now."""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+        pending = self._pending
+        self._pending = {}
+        for key, (target, option, value) in pending.items():
+            if key in self._current and self._current[key] == value:
+                continue
+            if option is None:
+                target.set(value)
+            else:
+                target[option] = value
+            self._current[key] = value
+            self.configures += 1
+
+    def forget(self, target):
+        """Call this when a widget or variable is no longer used."""
+        for key in list(self._current):
+            if key[0] == str(target):
+                del self._current[key]
+
+    def report(self):
+        return '%d requests, %d configures, %d skipped' % (
+            self.requests, self.configures, self.skipped)
@@ -0,0 +1,27 @@
+import tkinter
+from tkinter import ttk
+
+from tkgrid import ABOVE, LEFT, build_grid
+
+
+def make_button(parent, character):
+    # the 0 and = buttons get stretched, like in calculator.py
+    if character in {'0', '='}:
+        return ttk.Button(parent, text=character, width=1)
+    return ttk.Button(parent, text=character, width=3)
+
+
+root = tkinter.Tk()
+big_frame = ttk.Frame(root)
+big_frame.pack(fill='both', expand=True)
+
+rows = [
+    ['7', '8', '9', '*', '/'],
+    ['4', '5', '6', '+', '-'],
+    ['1', '2', '3', '=', LEFT],
+    ['0', LEFT, '.', ABOVE, ABOVE],
+]
+build_grid(big_frame, rows, make_button, stretch=True, sticky='nswe')
+
+root.title("Calculator")
+root.mainloop()
@@ -0,0 +1,24 @@
+import tkinter
+from tkinter import ttk
+
+from tkgrid import build_grid
+from tkresize import ResizeThrottler
+
+
+def make_button(parent, number):
+    return ttk.Button(parent, text=str(number), width=3)
+
+
+root = tkinter.Tk()
+big_frame = ttk.Frame(root)
+big_frame.pack(fill='both', expand=True)
+
+# 400 stretchy buttons, try resizing the window with and without the
+# throttler
+rows = [[y*20 + x for x in range(20)] for y in range(20)]
+build_grid(big_frame, rows, make_button, stretch=True, sticky='nswe')
+throttler = ResizeThrottler(root, big_frame)
+
+root.title("Dashboard")
+root.mainloop()
+print(throttler.report())
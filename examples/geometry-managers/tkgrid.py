@@ -0,0 +1,65 @@
+# put these to rows to make the widget on the left or above bigger
+LEFT = object()
+ABOVE = object()
+
+
+def build_grid(parent, rows, make_widget, stretch=False, **options):
+    """Create widgets from a list of rows and grid them all at once.
+
+    Each row is a list like in calculator.py. The items are passed to
+    make_widget(parent, item), and it must return a widget, except that
+    None leaves an empty place, LEFT makes the widget on the left span
+    to this place and ABOVE makes the widget above span to this place.
+    LEFT must come right after a widget or another LEFT, because Tk
+    doesn't know what to do with it otherwise. The keyword arguments
+    are grid options for all widgets, e.g. sticky='nswe', and
+    stretch=True sets the weights of all rows and columns to 1.
+
+    Calling .grid() for each widget runs a Tcl command for each widget,
+    but Tk's grid command can also take a whole row of widgets at once,
+    and that's what this does. Returns the widgets as a list of rows,
+    with None in the places that are not widgets.
+    """
+    # this is checked before creating any widgets
+    for y, row in enumerate(rows):
+        for x, item in enumerate(row):
+            if item is LEFT and (x == 0 or row[x-1] is None
+                                 or row[x-1] is ABOVE):
+                raise ValueError(
+                    "row %d: LEFT must be after a widget or LEFT" % y)
+
+    option_args = []
+    for name, value in options.items():
+        option_args.extend(['-' + name, value])
+
+    widget_rows = []
+    for y, row in enumerate(rows):
+        grid_args = []
+        widget_row = []
+        for item in row:
+            widget = None
+            if item is None:
+                grid_args.append('x')
+            elif item is LEFT:
+                grid_args.append('-')
+            elif item is ABOVE:
+                grid_args.append('^')
+            else:
+                widget = make_widget(parent, item)
+                grid_args.append(widget)
+            widget_row.append(widget)
+
+        if any(arg != 'x' for arg in grid_args):
+            # the widgets go to columns 0, 1, 2, ... of the row, and
+            # -in is needed for rows that contain only ABOVE
+            parent.tk.call('grid', 'configure', *grid_args, '-in', parent,
+                           '-row', y, *option_args)
+        widget_rows.append(widget_row)
+
+    if stretch and rows:
+        # this also takes many rows or columns at once
+        column_count = max(len(row) for row in rows)
+        parent.grid_columnconfigure(tuple(range(column_count)), weight=1)
+        parent.grid_rowconfigure(tuple(range(len(rows))), weight=1)
+
+    return widget_rows
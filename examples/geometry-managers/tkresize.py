@@ -0,0 +1,102 @@
+class ResizeThrottler:
+    """Lay out a frame again only after the window stops resizing.
+
+    When the user resizes a window by dragging its corner, the window
+    gets a new size many times a second, and Tk lays out everything in
+    it every time. With lots of stretchy widgets, that's slow and the
+    resizing looks choppy. This keeps the frame at its old size while
+    the window is being resized, so the widgets in it don't need to be
+    laid out, and when the window hasn't been resized for delay
+    milliseconds, the frame fills the window again and gets laid out
+    just once.
+
+    The frame must be packed or gridded into the window. The attributes
+    tell how it has been going: resizes is the number of times that the
+    window got a new size, and relayouts is the number of times that the
+    frame got a new size.
+    """
+
+    def __init__(self, window, frame, delay=100):
+        if frame.winfo_manager() not in {'pack', 'grid'}:
+            raise ValueError("the frame must be packed or gridded")
+        self.window = window
+        self.frame = frame
+        self.delay = delay
+        self.resizes = 0
+        self.relayouts = 0
+        self._window_size = None
+        self._after_id = None
+        self._saved_options = None      # not None while resizing
+        self._saved_manager_options = None
+        self._saved_propagate = None
+
+        # bindings of a toplevel window also run for the widgets in it,
+        # because the toplevel is in their bindtags, but this bindtag is
+        # only in the window's bindtags
+        tag = 'ResizeThrottler%d' % id(self)
+        window.bind_class(tag, '<Configure>', self._on_window_configure)
+        window.bindtags((tag,) + window.bindtags())
+        frame.bind('<Configure>', self._on_frame_configure, add=True)
+
+    def _on_window_configure(self, event):
+        size = (event.width, event.height)
+        if size == self._window_size:
+            # the window was moved, not resized
+            return
+        if self._window_size is None:
+            # the window appeared on the screen
+            self._window_size = size
+            return
+
+        self._window_size = size
+        self.resizes += 1
+        if self._saved_options is None:
+            self._freeze()
+        if self._after_id is not None:
+            self.window.after_cancel(self._after_id)
+        self._after_id = self.window.after(self.delay, self._unfreeze)
+
+    def _on_frame_configure(self, event):
+        self.relayouts += 1
+
+    def _freeze(self):
+        # the frame keeps its current size because it doesn't stretch
+        # and its size doesn't depend on the widgets in it
+        frame = self.frame
+        width = frame.winfo_width()
+        height = frame.winfo_height()
+        saved_options = {'width': frame['width'], 'height': frame['height']}
+        # the frame might not propagate on purpose
+        self._saved_propagate = (frame.pack_propagate(),
+                                 frame.grid_propagate())
+        frame.pack_propagate(False)
+        frame.grid_propagate(False)
+        frame.configure(width=width, height=height)
+
+        if frame.winfo_manager() == 'pack':
+            info = frame.pack_info()
+            self._saved_manager_options = {
+                'fill': info['fill'], 'expand': info['expand'],
+                'anchor': info['anchor']}
+            frame.pack_configure(fill='none', expand=False, anchor='nw')
+        else:
+            info = frame.grid_info()
+            self._saved_manager_options = {'sticky': info['sticky']}
+            frame.grid_configure(sticky='nw')
+        self._saved_options = saved_options
+
+    def _unfreeze(self):
+        self._after_id = None
+        frame = self.frame
+        frame.configure(**self._saved_options)
+        pack_propagate, grid_propagate = self._saved_propagate
+        frame.pack_propagate(pack_propagate)
+        frame.grid_propagate(grid_propagate)
+        if frame.winfo_manager() == 'pack':
+            frame.pack_configure(**self._saved_manager_options)
+        else:
+            frame.grid_configure(**self._saved_manager_options)
+        self._saved_options = None
+
+    def report(self):
+        return '%d resizes, %d relayouts' % (self.resizes, self.relayouts)
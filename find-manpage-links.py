@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Find out which markdown files link to manual pages.
+
+Run this with manual page names as arguments to see where they're
+linked, e.g. 'after(3tcl)', or without arguments to see all links.
+"""
+
+import glob
+import sys
+
+import manpages
+
+
+def main():
+    index = manpages.find_links(sorted(glob.glob('*.md')))
+    for manpage in (sys.argv[1:] or sorted(index)):
+        if manpage not in index:
+            print("%s: no links" % manpage)
+            continue
+        for filename, link in index[manpage]:
+            print("%s:%d:%d: %s" % (filename, link.lineno, link.column,
+                                    manpage))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+"""Simple include directives.
+
+This allows you to write markdown like this:
+
+    [include]: # (thing.py)
+    ```python
+    ```
+
+The [include] directive is abusing markdown's footnote syntax, so it
+won't be visible when the markdown is rendered.
+
+Then the markdown will be replaced with this:
+
+    [include]: # (thing.py)
+    ```python
+    here's the content of examples/name_of_the_markdown_file/thing.py
+    ```
+
+It's also possible to include only some lines or a function or class
+of the example file:
+
+    [include]: # (thing.py:10-20)
+    [include]: # (thing.py::some_function)
+    [include]: # (thing.py::SomeClass.some_method)
+
+Line numbers start at 1, and the last line is included too.
+
+The markdown is scanned once from start to end, so this takes linear
+time even with huge files or code blocks that are never closed.
+"""
+
+import ast
+import os
+import re
+import textwrap
+
+import mdtools
+
+
+# this matches only one line at a time, so it can't backtrack over the
+# whole file like a regex that matches entire code blocks
+_LINE_REGEX = re.compile(r'^(?:\[include\]: # \((.*)\)|```(.*))$',
+                         re.MULTILINE)
+_LINE_RANGE_REGEX = re.compile(r'(.*):(\d+)-(\d+)')
+
+# {path: (content, symbol_index)}, see get_symbol_index()
+_symbol_indexes = {}
+
+
+class IncludeError(Exception):
+    """Raised when the markdown contains broken include directives."""
+
+
+def get_symbol_index(path, content):
+    """Return a {name: (first_lineno, last_lineno)} dict.
+
+    The dict contains all functions and classes defined in the content,
+    and methods are named like 'SomeClass.some_method'. The file is
+    parsed again only if it has changed since the previous call.
+    """
+    try:
+        old_content, index = _symbol_indexes[path]
+        if old_content is content or old_content == content:
+            return index
+    except KeyError:
+        pass
+
+    index = {}
+    todo = [('', node) for node in ast.parse(content, path).body]
+    while todo:
+        prefix, node = todo.pop()
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef,
+                             ast.ClassDef)):
+            # decorators are a part of the definition
+            first = min([node.lineno] + [decorator.lineno
+                                         for decorator in node.decorator_list])
+            index[prefix + node.name] = (first, node.end_lineno)
+            if isinstance(node, ast.ClassDef):
+                todo.extend((prefix + node.name + '.', child)
+                            for child in node.body)
+
+    _symbol_indexes[path] = (content, index)
+    return index
+
+
+def read_example(chapter, name):
+    """Return the content of an example file or a part of it.
+
+    Raises LookupError if the requested part doesn't exist.
+    """
+    symbol = None
+    first = last = None
+    range_match = _LINE_RANGE_REGEX.fullmatch(name)
+    if '::' in name:
+        name, symbol = name.split('::', 1)
+    elif range_match is not None:
+        name = range_match.group(1)
+        first, last = map(int, range_match.group(2, 3))
+
+    path = os.path.join('examples', chapter, name)
+    content = mdtools.file_cache.read(path)
+    if symbol is None and first is None:
+        return content
+
+    lines = content.splitlines(keepends=True)
+    if symbol is not None:
+        try:
+            first, last = get_symbol_index(path, content)[symbol]
+        except KeyError:
+            raise LookupError(
+                "%s doesn't define %s" % (path, symbol)) from None
+    elif not 1 <= first <= last <= len(lines):
+        raise LookupError("%s has %d lines, can't include lines %d-%d" % (
+            path, len(lines), first, last))
+
+    # methods are indented, but the code block shouldn't be
+    result = textwrap.dedent(''.join(lines[first-1:last]))
+    if not result.endswith('\n'):
+        result += '\n'
+    return result
+
+
+def _error(filename, content, position, message):
+    lineno = content.count('\n', 0, position) + 1
+    return IncludeError("%s:%d: %s" % (filename, lineno, message))
+
+
+def update_includes(chapter, content):
+    filename = chapter + '.md'
+    result = []
+    copied_until = 0      # content[:copied_until] is already in result
+
+    # only the include directives and ``` lines are interesting, so
+    # everything else is skipped by the regex
+    include = None        # the directive match of the current code block
+    opening = None        # the ``` match that started the current block
+    waiting_for_block = False
+
+    for match in _LINE_REGEX.finditer(content):
+        if waiting_for_block:
+            # the directive must be followed by ``` on the next line
+            if (match.group(1) is not None
+                    or match.start() != include.end() + 1):
+                raise _error(filename, content, include.start(),
+                             "the include directive must be followed by "
+                             "a code block")
+            waiting_for_block = False
+            opening = match
+        elif opening is None:
+            if match.group(1) is not None:
+                include = match
+                waiting_for_block = True
+            else:
+                include = None
+                opening = match
+        elif match.group(2) == '':
+            # end of a code block
+            if include is not None:
+                result.append(content[copied_until:opening.end() + 1])
+                try:
+                    result.append(read_example(chapter, include.group(1)))
+                except LookupError as e:
+                    raise _error(filename, content, include.start(),
+                                 str(e)) from None
+                except OSError as e:
+                    # e.g. the included file doesn't exist
+                    raise _error(filename, content, include.start(),
+                                 "can't read %s: %s" % (e.filename,
+                                                        e.strerror)) from None
+                copied_until = match.start()
+            include = None
+            opening = None
+
+    if waiting_for_block:
+        raise _error(filename, content, include.start(),
+                     "the include directive must be followed by a code "
+                     "block")
+    if opening is not None:
+        raise _error(filename, content, (include or opening).start(),
+                     "code block is never closed")
+
+    result.append(content[copied_until:])
+    return ''.join(result)
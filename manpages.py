@@ -0,0 +1,243 @@
+"""Automatic manual page links.
+
+This searches for man page links and adds a list of them at the end of
+a markdown file, so you can write markdown like this:
+
+    See [the label man page][label(3tk)].
+
+The manual pages are looked up from manpage-snapshot.txt, or from a
+local copy of the Tcl/Tk HTML documentation if the TCLTK_DOC_DIR
+environment variable is set. Run this file with the documentation
+directory as an argument to update manpage-snapshot.txt.
+"""
+
+import collections
+import glob
+import json
+import os
+import re
+import sys
+
+import mdtools
+
+
+# these shouldn't conflict with Python code examples because 3tk and
+# 3tcl are invalid syntax in Python
+# this matches the lines that start and end the manpage list, or
+# [anything][any_word(3tcl or 3tk)] or just the second [...] part
+_SCAN_REGEX = re.compile(
+    r'^(?P<list>\[manpage list\]: # \((?:start|end)\))$'
+    r'|(?:\[.*?\])?\[(?P<manpage>\w+\(3(?:tk|tcl)\))\]', re.MULTILINE)
+
+# manpage is e.g. 'after(3tcl)', and lineno and column start at 1
+Link = collections.namedtuple('Link', ['manpage', 'lineno', 'column'])
+
+
+# we can't just do SOME_TEMPLATE % manpagename because tk_chooseColor(3tk)
+# is documented in TkCmd/chooseColor.htm, so we need an index of manual
+# pages that also helps with catching spelling errors, e.g. lable(3tk)
+URL_TEMPLATE = 'https://www.tcl.tk/man/tcl/%s.htm'
+SECTIONS = {'TkCmd': '3tk', 'TclCmd': '3tcl'}
+
+# this is used by default, set TCLTK_DOC_DIR to a directory with the
+# TkCmd and TclCmd subdirectories of the HTML documentation of Tcl and
+# Tk to use it instead
+SNAPSHOT = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        'manpage-snapshot.txt')
+INDEX_CACHE = '.manpage-index.json'
+
+# the names are in the NAME section of the page, like this:
+#   <H3><A NAME="M2">NAME</A></H3>
+#   tk_getOpenFile, tk_getSaveFile &mdash; pop up a dialog box ...
+_NAME_SECTION_REGEX = re.compile(
+    r'>NAME</A></H3>\s*(.*?)\s*(?:&mdash;|\\-| - )',
+    re.IGNORECASE | re.DOTALL)
+_TAG_REGEX = re.compile(r'<[^>]*>')
+
+_index = None
+
+
+class ManpageError(Exception):
+    """Raised for links to manual pages that don't exist."""
+
+
+def parse_names(html, page_name):
+    match = _NAME_SECTION_REGEX.search(html)
+    if match is None:
+        return [page_name]
+
+    names = []
+    for name in _TAG_REGEX.sub('', match.group(1)).split(','):
+        # ttk::button is in the ttk_button(3tk) man page
+        name = name.strip().replace('::', '_')
+        if re.fullmatch(r'\w+', name):
+            names.append(name)
+    return names or [page_name]
+
+
+def scan_doc_dir(doc_dir):
+    """Find all manual pages in a Tcl/Tk HTML documentation directory.
+
+    Returns a {manpage: page} dict like {'after(3tcl)': 'TclCmd/after'}.
+    """
+    index = {}
+    for subdir, section in SECTIONS.items():
+        for path in glob.glob(os.path.join(doc_dir, subdir, '*.htm')):
+            page_name = os.path.splitext(os.path.basename(path))[0]
+            with open(path, 'r', encoding='utf-8', errors='replace') as file:
+                names = parse_names(file.read(), page_name)
+            for name in names:
+                index['%s(%s)' % (name, section)] = subdir + '/' + page_name
+    return index
+
+
+def _get_signature(doc_dir):
+    # adding or removing pages changes the mtimes of the directories
+    signature = [os.path.abspath(doc_dir)]
+    for subdir in SECTIONS:
+        path = os.path.join(doc_dir, subdir)
+        signature.append([subdir, os.stat(path).st_mtime_ns,
+                          len(os.listdir(path))])
+    return signature
+
+
+def load_doc_dir_index(doc_dir):
+    """Like scan_doc_dir(), but use a cached index if possible."""
+    signature = _get_signature(doc_dir)
+    try:
+        with open(INDEX_CACHE, 'r') as file:
+            cache = json.load(file)
+        if cache['signature'] == signature:
+            return cache['index']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    index = scan_doc_dir(doc_dir)
+    mdtools.write_atomically(INDEX_CACHE, json.dumps(
+        {'signature': signature, 'index': index}, indent=2, sort_keys=True))
+    return index
+
+
+def load_snapshot(path=SNAPSHOT):
+    index = {}
+    with open(path, 'r') as file:
+        for line in file:
+            if line.strip() and not line.startswith('#'):
+                manpage, page = line.split()
+                index[manpage] = page
+    return index
+
+
+def get_index():
+    global _index
+    if _index is None:
+        doc_dir = os.environ.get('TCLTK_DOC_DIR')
+        if doc_dir:
+            _index = load_doc_dir_index(doc_dir)
+        else:
+            _index = load_snapshot()
+    return _index
+
+
+def get_index_signature():
+    """Return something that changes when the index may change."""
+    doc_dir = os.environ.get('TCLTK_DOC_DIR')
+    if doc_dir:
+        return _get_signature(doc_dir)
+    return mdtools.hash_file(SNAPSHOT)
+
+
+def get_url(manpage):
+    try:
+        return URL_TEMPLATE % get_index()[manpage]
+    except KeyError:
+        raise ManpageError("unknown manual page: " + manpage) from None
+
+
+def scan(content):
+    """Find all manual page links and the manpage list in one pass.
+
+    Returns a (links, list_span) tuple. The links are Link objects, and
+    list_span is a (start, end) tuple of indexes of content, or None if
+    there's no manpage list. The links in the manpage list are ignored.
+    """
+    links = []
+    list_start = list_span = None
+    lineno = 1
+    counted_until = 0
+
+    for match in _SCAN_REGEX.finditer(content):
+        if match.group('list') is not None:
+            if match.group('list').endswith('(start)'):
+                list_start = match.start()
+            elif list_start is not None and list_span is None:
+                list_span = (list_start, match.end())
+                list_start = None
+            continue
+        if list_start is not None:
+            # the manpage list contains links to everything in it
+            continue
+
+        start = match.start('manpage') - 1     # the [ before the manpage
+        lineno += content.count('\n', counted_until, start)
+        counted_until = start
+        column = start - content.rfind('\n', 0, start)
+        links.append(Link(match.group('manpage'), lineno, column))
+
+    if list_start is not None:
+        raise ManpageError("the manpage list on line %d is never closed" % (
+            content.count('\n', 0, list_start) + 1))
+    return (links, list_span)
+
+
+def find_links(filenames):
+    """Return a {manpage: [(filename, link), ...]} dict.
+
+    This is useful for finding out which files link to a manual page.
+    """
+    result = collections.defaultdict(list)
+    for filename in filenames:
+        with open(filename, 'r') as file:
+            links, list_span = scan(file.read())
+        for link in links:
+            result[link.manpage].append((filename, link))
+    return dict(result)
+
+
+def update_manpage_list(chapter, old_content):
+    links, list_span = scan(old_content)
+    if not links:
+        return old_content
+
+    lines = ['[manpage list]: # (start)']
+    for manpage in sorted({link.manpage for link in links}):
+        lines.append('[%s]: %s' % (manpage, get_url(manpage)))
+    lines.append('[manpage list]: # (end)')
+    manpage_list = '\n'.join(lines)
+
+    if list_span is None:
+        return ''.join([old_content, '\n', manpage_list, '\n'])
+
+    start, end = list_span
+    return ''.join([old_content[:start], manpage_list, old_content[end:]])
+
+
+# the urls come from the index, so the markdown files must be processed
+# again when it changes
+update_manpage_list.get_signature = get_index_signature
+
+
+def main():
+    if len(sys.argv) != 2:
+        sys.exit("Usage: %s TCL_TK_HTML_DOC_DIR > manpage-snapshot.txt"
+                 % sys.argv[0])
+
+    index = scan_doc_dir(sys.argv[1])
+    print("# manual page name and location in " + URL_TEMPLATE.split('%')[0])
+    print("# regenerate with: python3 manpages.py /path/to/tcl/html/docs")
+    for manpage in sorted(index, key=str.lower):
+        print(manpage, index[manpage])
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,322 @@
+"""Stuff for processing the markdown files of this tutorial.
+
+Each markdown file is read once, then all passes are applied to its
+content one by one, and the file is written at most once. A pass is a
+function like this:
+
+    def some_pass(chapter, content):
+        ...
+        return new_content
+
+Here chapter is the name of the markdown file without .md, e.g.
+'buttons'. The examples of that chapter are in examples/buttons.
+
+The sizes, modification times and hashes of the markdown files and the
+examples are saved to a manifest file, and chapters whose files haven't
+changed since the previous run are skipped. Everything is processed
+again if the source files of the passes change, and a pass that reads
+other files can have a get_signature attribute, which is a function
+that returns something JSON-compatible that changes when those files
+change. For example:
+
+    def get_signature():
+        return mdtools.hash_file('some-data-file.txt')
+
+    some_pass.get_signature = get_signature
+
+Passes should read other files with file_cache.read(path), so that files
+included many times are read from the disk only once.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import contextlib
+import glob
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import traceback
+
+
+MANIFEST = '.mdtools-cache.json'
+
+
+class FileCache:
+    """Remembers the contents of recently read files.
+
+    The modification time of the file is checked every time, so changed
+    files are read again. When the contents take more than max_size
+    characters, the least recently used files are forgotten.
+    """
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        # {path: (mtime, content)}, least recently used first
+        self._files = collections.OrderedDict()
+
+    def read(self, path):
+        mtime = os.stat(path).st_mtime_ns
+        try:
+            old_mtime, content = self._files[path]
+        except KeyError:
+            pass
+        else:
+            if old_mtime == mtime:
+                self.hits += 1
+                self._files.move_to_end(path)
+                return content
+            self._forget(path)
+
+        self.misses += 1
+        with open(path, 'r') as file:
+            content = file.read()
+        self._files[path] = (mtime, content)
+        self.size += len(content)
+        while self.size > self.max_size and len(self._files) > 1:
+            self._forget(next(iter(self._files)))
+            self.evictions += 1
+        return content
+
+    def _forget(self, path):
+        mtime, content = self._files.pop(path)
+        self.size -= len(content)
+
+    def get_stats(self):
+        return collections.Counter(
+            hits=self.hits, misses=self.misses, evictions=self.evictions)
+
+
+file_cache = FileCache(16 * 1024 * 1024)
+
+
+def get_inputs(filename):
+    # the examples that a markdown file can include are in
+    # examples/name_of_the_markdown_file
+    examples = os.path.join('examples', os.path.splitext(filename)[0], '*.py')
+    return [filename] + sorted(glob.glob(examples))
+
+
+def hash_file(path):
+    with open(path, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def get_signature(passes):
+    """Return a list that changes when what the passes do may change."""
+    signature = []
+    for a_pass in passes:
+        source_file = sys.modules[a_pass.__module__].__file__
+        signature.append([a_pass.__name__, hash_file(source_file)])
+        if hasattr(a_pass, 'get_signature'):
+            signature[-1].append(a_pass.get_signature())
+    return signature
+
+
+def file_info(path, old_info=None):
+    stat = os.stat(path)
+    info = {'size': stat.st_size, 'mtime': stat.st_mtime_ns}
+
+    # hashing is needed only if the file looks different than last time,
+    # e.g. 'git checkout' changes mtimes without changing the content
+    if (old_info is not None and old_info['size'] == info['size']
+            and old_info['mtime'] == info['mtime']):
+        info['hash'] = old_info['hash']
+    else:
+        info['hash'] = hash_file(path)
+    return info
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST, 'r') as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        # missing or broken, let's just process everything
+        return {}
+
+
+def write_atomically(filename, content):
+    """Write a file and return file_info() of what was written.
+
+    If something goes wrong while writing, the old file is left as is
+    instead of being replaced with a half-written file.
+    """
+    fd, temp_path = tempfile.mkstemp(
+        dir=(os.path.dirname(filename) or '.'), prefix='.tmp-')
+    try:
+        with open(fd, 'w') as file:
+            file.write(content)
+        # mkstemp() creates the file with 0600 permissions, and new files
+        # get the same permissions as open() would give them
+        try:
+            mode = os.stat(filename).st_mode
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            mode = 0o666 & ~umask
+        os.chmod(temp_path, mode)
+        # nothing else writes to the temporary file, and renaming it
+        # doesn't change its modification time
+        info = file_info(temp_path)
+        os.replace(temp_path, filename)
+    except BaseException:
+        os.remove(temp_path)
+        raise
+    return info
+
+
+def is_unchanged(old_infos, new_infos):
+    """Check if a markdown file and its examples are like last time."""
+    if old_infos is None or sorted(old_infos) != sorted(new_infos):
+        # first time, or an example was added or removed
+        return False
+    return all(new_infos[path]['hash'] == old_infos[path]['hash']
+               for path in new_infos)
+
+
+def run_passes(filename, passes):
+    """Apply the passes to a markdown file's content.
+
+    Returns a (old_content, new_content) tuple.
+    """
+    with open(filename, 'r') as file:
+        old_content = file.read()
+
+    chapter = os.path.splitext(filename)[0]
+    new_content = old_content
+    for a_pass in passes:
+        new_content = a_pass(chapter, new_content)
+    return (old_content, new_content)
+
+
+def process_file(filename, passes, old_infos, check):
+    """Process one markdown file.
+
+    This runs in a worker process when --jobs is used, so instead of
+    printing anything, this returns a (messages, new_infos, status,
+    cache_stats) tuple. The status is 'ok', 'needs-update' or 'failed',
+    new_infos is None if the file isn't ok yet, and cache_stats tells
+    how file_cache was used while processing this file.
+    """
+    stats_before = file_cache.get_stats()
+    messages, new_infos, status = _process_file(
+        filename, passes, old_infos, check)
+    return (messages, new_infos, status,
+            file_cache.get_stats() - stats_before)
+
+
+def _process_file(filename, passes, old_infos, check):
+    try:
+        # the files are looked at before running the passes, so if a
+        # file changes while the passes run, the manifest has the old
+        # hash and the file is processed again next time
+        new_infos = {path: file_info(path, (old_infos or {}).get(path))
+                     for path in get_inputs(filename)}
+        if is_unchanged(old_infos, new_infos):
+            return (["Already OK (unchanged): " + filename], new_infos, 'ok')
+
+        old_content, new_content = run_passes(filename, passes)
+        if new_content == old_content:
+            messages = ["Already OK: " + filename]
+        elif check:
+            return (["Needs updating: " + filename], None, 'needs-update')
+        else:
+            new_infos[filename] = write_atomically(filename, new_content)
+            messages = ["Updating %s ..." % filename, "  done."]
+        return (messages, new_infos, 'ok')
+
+    except Exception:
+        # the traceback is printed in the main process
+        return (["Failed: " + filename, traceback.format_exc()], None,
+                'failed')
+
+
+def main(passes):
+    """Run the passes on all markdown files and report what happened.
+
+    This also handles command-line arguments.
+    """
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        '--check', action='store_true',
+        help="don't write anything, exit with status 1 if something "
+             "needs updating")
+    parser.add_argument(
+        '--force', action='store_true',
+        help="process all files even if they haven't changed")
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1, metavar='N',
+        help="process N markdown files at the same time (default: 1)")
+    parser.add_argument(
+        '--stats', action='store_true',
+        help="print how many files were read from the disk")
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
+
+    # different scripts run different passes, so a file that is up to
+    # date for one script isn't necessarily up to date for another
+    manifest = load_manifest()
+    pipeline = ','.join(a_pass.__name__ for a_pass in passes)
+    signature = get_signature(passes)
+    previous = {}
+    if (not args.force and pipeline in manifest
+            and manifest[pipeline].get('signature') == signature):
+        previous = manifest[pipeline]['files']
+
+    filenames = sorted(glob.glob('*.md'))
+    old_infos = [previous.get(filename) for filename in filenames]
+    map_arguments = (process_file, filenames, [passes] * len(filenames),
+                     old_infos, [args.check] * len(filenames))
+
+    infos = {}
+    failed = []
+    needs_update = []
+    cache_stats = collections.Counter()
+    with contextlib.ExitStack() as stack:
+        if args.jobs == 1:
+            results = map(*map_arguments)
+        else:
+            executor = stack.enter_context(
+                concurrent.futures.ProcessPoolExecutor(args.jobs))
+            # this yields the results in the same order as without
+            # --jobs, no matter which file gets processed first
+            results = executor.map(*map_arguments)
+
+        for filename, result in zip(filenames, results):
+            messages, new_infos, status, file_cache_stats = result
+            cache_stats += file_cache_stats
+            for message in messages:
+                print(message)
+            if new_infos is not None:
+                infos[filename] = new_infos
+            if status == 'failed':
+                failed.append(filename)
+            elif status == 'needs-update':
+                needs_update.append(filename)
+
+    # check mode doesn't write anything, so that it works in read-only
+    # checkouts
+    if not args.check:
+        manifest[pipeline] = {'signature': signature, 'files': infos}
+        write_atomically(MANIFEST,
+                         json.dumps(manifest, indent=2, sort_keys=True))
+
+    if args.stats:
+        print()
+        print("File cache: %d hits, %d misses, %d evictions" % (
+            cache_stats['hits'], cache_stats['misses'],
+            cache_stats['evictions']))
+    if failed:
+        print()
+        print("%d of %d files failed: %s" % (
+            len(failed), len(filenames), ', '.join(failed)))
+    if failed or needs_update:
+        sys.exit(1)
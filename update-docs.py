@@ -0,0 +1,14 @@
+#!/usr/bin/env python3
+"""Do everything that update-includes.py and link-manpages.py do.
+
+This is faster than running the two scripts separately because each
+markdown file is read and written only once.
+"""
+
+import includes
+import manpages
+import mdtools
+
+
+if __name__ == '__main__':
+    mdtools.main([includes.update_includes, manpages.update_manpage_list])